@@ -5,12 +5,19 @@ from __future__ import annotations
 import json
 import logging
 import os
-from dataclasses import asdict, dataclass
+import stat
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 LOGGER = logging.getLogger(__name__)
 
+try:  # pragma: no cover - optional speedup
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - executed when orjson is not installed
+    _orjson = None
+
 
 def _sanitize_machine_id(machine_id: str) -> str:
     """Return a canonical machine identifier."""
@@ -18,6 +25,43 @@ def _sanitize_machine_id(machine_id: str) -> str:
     return machine_id.strip().upper()
 
 
+def json_dumps(data: Any, *, compact: bool = False) -> bytes:
+    """Serialize ``data`` as JSON bytes, using orjson when available.
+
+    Output is indented for the human-edited files unless ``compact`` is set.
+    """
+
+    if _orjson is not None:
+        option = 0 if compact else _orjson.OPT_INDENT_2
+        return _orjson.dumps(data, option=option, default=str)
+    if compact:
+        return json.dumps(data, separators=(",", ":"), default=str).encode()
+    return json.dumps(data, indent=2, default=str).encode()
+
+
+def json_loads(raw: bytes) -> Any:
+    """Parse JSON ``raw`` bytes, using orjson when available."""
+
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw)
+
+
+def fsync_directory(path: Path) -> None:
+    """Persist a rename inside ``path``; best effort where directories cannot be opened."""
+
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        LOGGER.debug("Failed to sync directory %s", path, exc_info=True)
+    finally:
+        os.close(fd)
+
+
 def _determine_config_dir() -> Path:
     """Return the directory used for configuration and state files.
 
@@ -35,11 +79,30 @@ def _determine_config_dir() -> Path:
     return Path.home() / ".config" / "fw_cycle_monitor"
 
 
-CONFIG_DIR = _determine_config_dir()
-CONFIG_PATH = CONFIG_DIR / "config.json"
+@lru_cache(maxsize=1)
+def get_config_dir() -> Path:
+    """Return the configuration directory, resolving it on first use."""
+
+    return _determine_config_dir()
+
+
+def get_config_path() -> Path:
+    """Return the path of the JSON configuration file."""
 
+    return get_config_dir() / "config.json"
 
-@dataclass
+
+def __getattr__(name: str) -> Any:
+    # ``CONFIG_DIR``/``CONFIG_PATH`` used to be computed at import time; keep
+    # them available as attributes but only resolve them when requested.
+    if name == "CONFIG_DIR":
+        return get_config_dir()
+    if name == "CONFIG_PATH":
+        return get_config_path()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@dataclass(frozen=True)
 class AppConfig:
     """User editable configuration."""
 
@@ -49,18 +112,36 @@ class AppConfig:
     reset_hour: int = 4
 
     def __post_init__(self) -> None:
-        self.machine_id = _sanitize_machine_id(self.machine_id)
+        # The instance is frozen, so normalize the fields once here and derive
+        # the CSV path up front instead of on every ``csv_path()`` call.
+        object.__setattr__(self, "machine_id", _sanitize_machine_id(self.machine_id))
         if not isinstance(self.csv_directory, Path):
-            self.csv_directory = Path(self.csv_directory)
+            object.__setattr__(self, "csv_directory", Path(self.csv_directory))
+        object.__setattr__(
+            self,
+            "_csv_path",
+            self.csv_directory.expanduser() / f"CM_{self.machine_id}.csv",
+        )
 
     def csv_path(self) -> Path:
         """Return the CSV path derived from the machine id."""
 
-        sanitized_machine = _sanitize_machine_id(self.machine_id)
-        return Path(self.csv_directory).expanduser() / f"CM_{sanitized_machine}.csv"
+        return self._csv_path
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AppConfig":
+        try:
+            key = tuple(
+                sorted((k, str(v) if isinstance(v, Path) else v) for k, v in data.items())
+            )
+            hash(key)
+        except TypeError:
+            # Unhashable or unorderable content; build without the cache.
+            return cls._from_mapping(data)
+        return _config_from_items(key)
+
+    @classmethod
+    def _from_mapping(cls, data: Dict[str, Any]) -> "AppConfig":
         defaults = cls()
         csv_directory = Path(data.get("csv_directory", defaults.csv_directory))
         try:
@@ -78,51 +159,122 @@ class AppConfig:
         )
 
 
+@lru_cache(maxsize=32)
+def _config_from_items(items: Tuple[Tuple[str, Any], ...]) -> AppConfig:
+    """Build an ``AppConfig`` from frozen items; shared safely as it is frozen."""
+
+    return AppConfig._from_mapping(dict(items))
+
+
+# Last configuration read from or written to disk by this process.  Used by
+# ``save_config`` to detect machine changes without re-parsing the file.
+_LAST_SAVED: AppConfig | None = None
+
+
 def ensure_config_dir() -> None:
     """Ensure the configuration directory exists."""
 
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    get_config_dir().mkdir(parents=True, exist_ok=True)
 
 
 def load_config() -> AppConfig:
     """Load configuration from disk, returning defaults when missing."""
 
+    global _LAST_SAVED
+
     ensure_config_dir()
-    if not CONFIG_PATH.exists():
-        LOGGER.debug("Config file %s not found; using defaults", CONFIG_PATH)
+    config_path = get_config_path()
+    if not config_path.exists():
+        LOGGER.debug("Config file %s not found; using defaults", config_path)
         return AppConfig()
 
     try:
-        data = json.loads(CONFIG_PATH.read_text())
+        data = json_loads(config_path.read_bytes())
         LOGGER.debug("Loaded config: %s", data)
-        return AppConfig.from_dict(data)
+        config = AppConfig.from_dict(data)
     except (json.JSONDecodeError, OSError) as exc:
-        LOGGER.warning("Failed to load config %s: %s", CONFIG_PATH, exc)
+        LOGGER.warning("Failed to load config %s: %s", config_path, exc)
         return AppConfig()
 
+    _LAST_SAVED = config
+    return config
+
 
 def save_config(config: AppConfig) -> None:
     """Persist configuration to disk."""
 
+    global _LAST_SAVED
+
     ensure_config_dir()
+    config_path = get_config_path()
 
-    previous_config: AppConfig | None = None
-    if CONFIG_PATH.exists():
+    previous_config = _LAST_SAVED
+    if previous_config is None and config_path.exists():
         try:
-            existing = json.loads(CONFIG_PATH.read_text())
+            existing = json_loads(config_path.read_bytes())
             previous_config = AppConfig.from_dict(existing)
         except (json.JSONDecodeError, OSError, ValueError, TypeError):
             LOGGER.debug("Existing configuration could not be loaded for comparison", exc_info=True)
 
-    serializable = asdict(config)
-    serializable["csv_directory"] = str(config.csv_directory)
-    CONFIG_PATH.write_text(json.dumps(serializable, indent=2))
-    LOGGER.debug("Saved config to %s", CONFIG_PATH)
+    serializable = {
+        "machine_id": config.machine_id,
+        "gpio_pin": config.gpio_pin,
+        "csv_directory": str(config.csv_directory),
+        "reset_hour": config.reset_hour,
+    }
+    new_bytes = json_dumps(serializable)
+
+    try:
+        unchanged = config_path.read_bytes() == new_bytes
+    except OSError:
+        unchanged = False
+
+    if unchanged:
+        LOGGER.debug("Config at %s is unchanged; skipping write", config_path)
+    else:
+        _replace_preserving_metadata(config_path, new_bytes)
+        LOGGER.debug("Saved config to %s", config_path)
+    _LAST_SAVED = config
 
     if previous_config:
         _handle_machine_change(previous_config, config)
 
 
+def _replace_preserving_metadata(path: Path, data: bytes) -> None:
+    """Atomically replace ``path`` with ``data``, keeping its mode and owner.
+
+    The replacement is a new inode, so the existing file's permission bits
+    and ownership (as set by the installer or an operator) are copied onto
+    it first. When the owner cannot be carried over, the file is rewritten
+    in place instead so ownership is never silently changed.
+    """
+
+    try:
+        existing = path.stat()
+    except FileNotFoundError:
+        existing = None
+
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        tmp_path.write_bytes(data)
+        if existing is not None:
+            os.chmod(tmp_path, stat.S_IMODE(existing.st_mode))
+            if (existing.st_uid, existing.st_gid) != (os.geteuid(), os.getegid()):
+                try:
+                    os.chown(tmp_path, existing.st_uid, existing.st_gid)
+                except PermissionError:
+                    tmp_path.unlink()
+                    path.write_bytes(data)
+                    return
+        tmp_path.replace(path)
+    except OSError:
+        try:
+            tmp_path.unlink(missing_ok=True)  # type: ignore[arg-type]
+        except OSError:
+            LOGGER.debug("Failed to remove temporary config file %s", tmp_path, exc_info=True)
+        raise
+
+
 def _handle_machine_change(previous: AppConfig, current: AppConfig) -> None:
     """Clean up state tied to a prior machine configuration."""
 
@@ -160,16 +312,15 @@ def _remove_machine_sidecars(machine_id: str, csv_directory: Path) -> None:
         return
 
     csv_dir = csv_directory.expanduser()
-    base = csv_dir / f"CM_{sanitized}.csv"
-    targets = [
-        base.with_name(base.name + ".pending"),
-        base.with_name(base.name + ".state.json"),
-    ]
+    stem = f"CM_{sanitized}.csv"
+    targets = [csv_dir / (stem + ".pending"), csv_dir / (stem + ".state.json")]
 
     for path in targets:
         try:
-            if path.exists():
-                path.unlink()
-                LOGGER.info("Removed stale file %s for retired machine %s", path, sanitized)
+            path.unlink()
+        except FileNotFoundError:
+            continue
         except OSError:
             LOGGER.warning("Failed to remove stale file %s", path, exc_info=True)
+        else:
+            LOGGER.info("Removed stale file %s for retired machine %s", path, sanitized)
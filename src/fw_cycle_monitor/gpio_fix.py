@@ -5,8 +5,10 @@ from __future__ import annotations
 import json
 import logging
 import os
+import platform
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -15,47 +17,129 @@ LOGGER = logging.getLogger(__name__)
 __all__ = ["ensure_gpio_compatibility"]
 
 
+def _read_os_release_codename() -> Optional[str]:
+    """Return VERSION_CODENAME by scanning /etc/os-release (Python < 3.10)."""
+    with open("/etc/os-release") as f:
+        for line in f:
+            if line.startswith("VERSION_CODENAME="):
+                return line.partition("=")[2].strip().strip("\"'")
+    return None
+
+
+@lru_cache(maxsize=1)
 def _is_debian_trixie() -> bool:
-    """Check if running on Debian 13 (Trixie)."""
+    """Check if running on Debian 13 (Trixie).
+
+    The OS release cannot change while the process runs, so the result is
+    cached after the first lookup.
+    """
     try:
-        with open("/etc/os-release") as f:
-            content = f.read()
-            return "trixie" in content.lower()
-    except FileNotFoundError:
+        codename = platform.freedesktop_os_release().get("VERSION_CODENAME")
+    except AttributeError:
+        try:
+            codename = _read_os_release_codename()
+        except OSError:
+            return False
+    except OSError:
         return False
+    return (codename or "").lower() == "trixie"
+
+
+_DPKG_STATUS_PATH = Path("/var/lib/dpkg/status")
+
 
+@lru_cache(maxsize=1)
+def _load_dpkg_status() -> dict[str, bool]:
+    """Parse the dpkg status database into a ``{package: installed}`` map.
 
-def _is_package_installed(package: str) -> bool:
-    """Check if a Debian package is installed."""
+    Raises ``OSError`` when the database cannot be read.  The result is cached;
+    call ``_load_dpkg_status.cache_clear()`` after changing installed packages.
+    """
+    installed: dict[str, bool] = {}
+    package: Optional[str] = None
+    status = ""
+    with _DPKG_STATUS_PATH.open(encoding="utf-8", errors="replace") as handle:
+        for line in handle:
+            if line.startswith("Package:"):
+                package = line[len("Package:"):].strip()
+            elif line.startswith("Status:"):
+                status = line[len("Status:"):].strip()
+            elif not line.strip():
+                if package:
+                    # Multi-arch packages may have several stanzas; any
+                    # installed instance counts.
+                    installed[package] = installed.get(package, False) or (
+                        status == "install ok installed"
+                    )
+                package = None
+                status = ""
+    if package:
+        installed[package] = installed.get(package, False) or status == "install ok installed"
+    return installed
+
+
+def _query_installed(packages: list[str]) -> dict[str, bool]:
+    """Return the install state of several Debian packages."""
+    try:
+        status = _load_dpkg_status()
+    except OSError as exc:
+        LOGGER.debug("Unable to read %s (%s); falling back to dpkg-query", _DPKG_STATUS_PATH, exc)
+    else:
+        return {package: status.get(package, False) for package in packages}
+
+    installed = {package: False for package in packages}
     try:
         result = subprocess.run(
-            ["dpkg", "-l", package],
+            ["dpkg-query", "-W", "-f=${Package}\t${Status}\n", *packages],
             capture_output=True,
             text=True,
             timeout=5,
         )
-        return result.returncode == 0 and package in result.stdout
     except (subprocess.TimeoutExpired, FileNotFoundError):
-        return False
+        return installed
+
+    # dpkg-query exits non-zero when any package is unknown but still reports
+    # the ones it knows about, so parse stdout regardless of the return code.
+    for line in result.stdout.splitlines():
+        name, _, state = line.partition("\t")
+        if name in installed:
+            installed[name] = "install ok installed" in state
+    return installed
+
+
+_APT_ENV: Optional[dict[str, str]] = None
 
 
-def _install_system_package(package: str) -> bool:
-    """Install a system package using apt-get."""
+def _apt_env() -> dict[str, str]:
+    """Return the environment for apt-get, built once per process."""
+    global _APT_ENV
+    if _APT_ENV is None:
+        env = os.environ.copy()
+        env["DEBIAN_FRONTEND"] = "noninteractive"
+        _APT_ENV = env
+    return _APT_ENV
+
+
+def _install_system_package(*packages: str) -> bool:
+    """Install one or more system packages with a single apt-get call."""
+    names = " ".join(packages)
     try:
-        LOGGER.info("Installing system package: %s", package)
+        LOGGER.info("Installing system package: %s", names)
         result = subprocess.run(
-            ["sudo", "apt-get", "install", "-y", package],
-            capture_output=True,
+            ["sudo", "apt-get", "install", "-y", *packages],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             timeout=120,
-            env={**os.environ, "DEBIAN_FRONTEND": "noninteractive"},
+            env=_apt_env(),
         )
+        _load_dpkg_status.cache_clear()
         if result.returncode != 0:
-            LOGGER.warning("Failed to install %s: %s", package, result.stderr)
+            LOGGER.warning("Failed to install %s: %s", names, result.stderr)
             return False
         return True
     except (subprocess.TimeoutExpired, FileNotFoundError) as exc:
-        LOGGER.warning("Failed to install %s: %s", package, exc)
+        LOGGER.warning("Failed to install %s: %s", names, exc)
         return False
 
 
@@ -65,16 +149,51 @@ def _remove_system_package(package: str) -> bool:
         LOGGER.info("Removing incompatible package: %s", package)
         result = subprocess.run(
             ["sudo", "apt-get", "remove", "-y", package],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             timeout=120,
-            env={**os.environ, "DEBIAN_FRONTEND": "noninteractive"},
+            env=_apt_env(),
         )
+        _load_dpkg_status.cache_clear()
         return result.returncode == 0
     except (subprocess.TimeoutExpired, FileNotFoundError):
         return False
 
 
+@lru_cache(maxsize=8)
+def _glob_site_packages(venv_path: Path) -> Optional[Path]:
+    """Search ``venv_path`` for a site-packages directory."""
+    matches = sorted(venv_path.glob("lib/python*/site-packages"))
+    return matches[0] if matches else None
+
+
+def _site_packages_dir(venv_path: Path) -> Optional[Path]:
+    """Return the site-packages directory of ``venv_path`` if it exists."""
+    # The venv is normally built with the interpreter running this code, so
+    # try the exact path before falling back to a directory scan.
+    version = f"python{sys.version_info.major}.{sys.version_info.minor}"
+    site_packages = venv_path / "lib" / version / "site-packages"
+    if site_packages.is_dir():
+        return site_packages
+    return _glob_site_packages(venv_path)
+
+
+_RPI_GPIO_DIST_PREFIXES = ("rpi.gpio-", "rpi_gpio-")
+
+
+def _venv_has_rpi_gpio(site_packages: Path) -> bool:
+    """Return True if RPi.GPIO distribution metadata exists in ``site_packages``."""
+    try:
+        entries = [entry.name.lower() for entry in site_packages.iterdir()]
+    except OSError:
+        return False
+    return any(
+        name.startswith(_RPI_GPIO_DIST_PREFIXES) and name.endswith((".dist-info", ".egg-info"))
+        for name in entries
+    )
+
+
 def _remove_venv_rpi_gpio(venv_path: Path) -> bool:
     """Remove RPi.GPIO from virtual environment."""
     pip_path = venv_path / "bin" / "pip"
@@ -82,15 +201,21 @@ def _remove_venv_rpi_gpio(venv_path: Path) -> bool:
         return True
 
     try:
-        # Check if RPi.GPIO is installed in venv
-        result = subprocess.run(
-            [str(pip_path), "show", "RPi.GPIO"],
-            capture_output=True,
-            timeout=10,
-        )
-        if result.returncode != 0:
-            # Not installed, nothing to do
-            return True
+        # Check if RPi.GPIO is installed in venv, preferring a metadata probe
+        # over starting pip
+        site_packages = _site_packages_dir(venv_path)
+        if site_packages is not None:
+            if not _venv_has_rpi_gpio(site_packages):
+                return True
+        else:
+            result = subprocess.run(
+                [str(pip_path), "show", "RPi.GPIO"],
+                capture_output=True,
+                timeout=10,
+            )
+            if result.returncode != 0:
+                # Not installed, nothing to do
+                return True
 
         LOGGER.info("Removing incompatible RPi.GPIO from venv")
         result = subprocess.run(
@@ -114,12 +239,12 @@ def _create_system_packages_pth(venv_path: Path) -> bool:
     """Create .pth file to allow venv access to system packages."""
     try:
         # Find the site-packages directory
-        site_packages = list(venv_path.glob("lib/python*/site-packages"))
-        if not site_packages:
+        site_packages = _site_packages_dir(venv_path)
+        if site_packages is None:
             LOGGER.warning("Could not find site-packages in venv")
             return False
 
-        pth_file = site_packages[0] / "system-packages.pth"
+        pth_file = site_packages / "system-packages.pth"
         pth_file.write_text("/usr/lib/python3/dist-packages\n")
         LOGGER.info("Created system-packages.pth for venv")
         return True
@@ -128,21 +253,60 @@ def _create_system_packages_pth(venv_path: Path) -> bool:
         return False
 
 
+_COMPAT_MARKER_NAME = ".gpio_compat_ok"
+_PIN22_MARKER_NAME = ".pin22.ok"
+_LAST_PIN22_CHECK_MTIME: Optional[int] = None
+
+
+def _read_pin22_marker(marker_path: Path) -> Optional[int]:
+    """Return the config mtime recorded by the last successful pin check."""
+    try:
+        return int(marker_path.read_text().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def _record_pin22_check(config_path: Path, marker_path: Path) -> None:
+    """Remember the config mtime so unchanged configs skip the next check."""
+    global _LAST_PIN22_CHECK_MTIME
+    try:
+        mtime = config_path.stat().st_mtime_ns
+    except OSError:
+        return
+    _LAST_PIN22_CHECK_MTIME = mtime
+    try:
+        marker_path.write_text(f"{mtime}\n")
+    except OSError as exc:
+        LOGGER.debug("Failed to write GPIO pin marker %s: %s", marker_path, exc)
+
+
 def _ensure_gpio_pin_22() -> bool:
     """Ensure GPIO pin is set to 22 in the config file."""
+    global _LAST_PIN22_CHECK_MTIME
     try:
         # Import config module to get the config path
-        from .config import CONFIG_PATH
+        from .config import get_config_dir, get_config_path, json_dumps, json_loads
+
+        config_path = get_config_path()
+        marker_path = get_config_dir() / _PIN22_MARKER_NAME
 
         # Check if config file exists
-        if not CONFIG_PATH.exists():
+        try:
+            mtime = config_path.stat().st_mtime_ns
+        except FileNotFoundError:
             LOGGER.info("Config file doesn't exist yet, will be created with default GPIO pin 22")
             return True
 
+        # Skip the read when the config has not changed since the last check
+        if _LAST_PIN22_CHECK_MTIME is None:
+            _LAST_PIN22_CHECK_MTIME = _read_pin22_marker(marker_path)
+        if mtime == _LAST_PIN22_CHECK_MTIME:
+            LOGGER.debug("GPIO pin already verified for unchanged config")
+            return True
+
         # Read existing config
         try:
-            with open(CONFIG_PATH, "r") as f:
-                config = json.load(f)
+            config = json_loads(config_path.read_bytes())
         except (json.JSONDecodeError, OSError) as exc:
             LOGGER.warning("Failed to read config file: %s", exc)
             return False
@@ -151,6 +315,7 @@ def _ensure_gpio_pin_22() -> bool:
         current_pin = config.get("gpio_pin", 2)
         if current_pin == 22:
             LOGGER.debug("GPIO pin already set to 22")
+            _record_pin22_check(config_path, marker_path)
             return True
 
         # Update GPIO pin to 22
@@ -158,19 +323,45 @@ def _ensure_gpio_pin_22() -> bool:
 
         # Write back to config file
         try:
-            with open(CONFIG_PATH, "w") as f:
-                json.dump(config, f, indent=2)
+            config_path.write_bytes(json_dumps(config))
             LOGGER.info("Updated GPIO pin to 22 in config (was %s)", current_pin)
-            return True
         except OSError as exc:
             LOGGER.warning("Failed to write config file: %s", exc)
             return False
+        _record_pin22_check(config_path, marker_path)
+        return True
 
     except Exception as exc:
         LOGGER.warning("Failed to ensure GPIO pin 22: %s", exc)
         return False
 
 
+def _compat_marker_current(venv_path: Path) -> bool:
+    """Return True if the venv marker is newer than site-packages and dpkg status."""
+    try:
+        marker_mtime = (venv_path / _COMPAT_MARKER_NAME).stat().st_mtime_ns
+    except OSError:
+        return False
+    site_packages = _site_packages_dir(venv_path)
+    for path in (site_packages, _DPKG_STATUS_PATH):
+        if path is None:
+            continue
+        try:
+            if path.stat().st_mtime_ns > marker_mtime:
+                return False
+        except OSError:
+            continue
+    return True
+
+
+def _record_compat_marker(venv_path: Path) -> None:
+    """Touch the venv marker after a successful compatibility pass."""
+    try:
+        (venv_path / _COMPAT_MARKER_NAME).touch()
+    except OSError as exc:
+        LOGGER.debug("Failed to write GPIO compatibility marker in %s: %s", venv_path, exc)
+
+
 def ensure_gpio_compatibility(venv_path: Optional[Path] = None, set_gpio_pin_22: bool = True) -> bool:
     """
     Ensure GPIO compatibility on Debian 13.
@@ -195,34 +386,57 @@ def ensure_gpio_compatibility(venv_path: Optional[Path] = None, set_gpio_pin_22:
         LOGGER.debug("Not running on Debian 13, skipping GPIO compatibility fix")
         return True
 
+    # Packages and the venv only change through apt or pip, both of which
+    # bump the mtimes the marker is compared against.
+    if venv_path and venv_path.exists() and _compat_marker_current(venv_path):
+        LOGGER.debug("GPIO compatibility already verified for %s", venv_path)
+        if set_gpio_pin_22:
+            _ensure_gpio_pin_22()
+        return True
+
     LOGGER.info("Applying GPIO compatibility fix for Debian 13...")
 
+    installed = _query_installed(["python3-rpi.gpio", "python3-rpi-lgpio", "python3-lgpio"])
+    # Only a pass where every step succeeded may record the marker; otherwise
+    # the next start has to try again.
+    complete = True
+
     # Remove incompatible python3-rpi.gpio if installed
-    if _is_package_installed("python3-rpi.gpio"):
+    if installed["python3-rpi.gpio"]:
         if not _remove_system_package("python3-rpi.gpio"):
             LOGGER.warning("Failed to remove python3-rpi.gpio, continuing anyway")
+            complete = False
 
-    # Install python3-rpi-lgpio compatibility shim
-    if not _is_package_installed("python3-rpi-lgpio"):
-        if not _install_system_package("python3-rpi-lgpio"):
+    # Install python3-rpi-lgpio compatibility shim and its lgpio dependency
+    to_install = [package for package in ("python3-rpi-lgpio", "python3-lgpio") if not installed[package]]
+    if not installed["python3-rpi-lgpio"]:
+        if not _install_system_package(*to_install):
             LOGGER.error("Failed to install python3-rpi-lgpio")
             return False
     else:
         LOGGER.debug("python3-rpi-lgpio already installed")
-
-    # Install lgpio dependency
-    if not _is_package_installed("python3-lgpio"):
-        _install_system_package("python3-lgpio")
+        if to_install and not _install_system_package(*to_install):
+            complete = False
 
     # Handle venv if provided
-    if venv_path and venv_path.exists():
-        _remove_venv_rpi_gpio(venv_path)
-        _create_system_packages_pth(venv_path)
+    has_venv = bool(venv_path and venv_path.exists())
+    if has_venv:
+        if not _remove_venv_rpi_gpio(venv_path):
+            complete = False
+        if not _create_system_packages_pth(venv_path):
+            complete = False
 
     # Set GPIO pin to 22 if requested
     if set_gpio_pin_22:
         _ensure_gpio_pin_22()
 
+    if not complete:
+        LOGGER.warning("GPIO compatibility fix only partially applied; it will be retried on next start")
+        return True
+
+    if has_venv:
+        _record_compat_marker(venv_path)
+
     LOGGER.info("GPIO compatibility fix applied successfully")
     return True
 
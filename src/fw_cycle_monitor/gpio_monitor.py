@@ -2,24 +2,50 @@
 
 from __future__ import annotations
 
+import collections
 import csv
+import itertools
 import json
 import logging
 import os
 import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Callable, Optional
 
 from .config import AppConfig
-from .metrics import record_cycle_event
-from .state import MachineState, load_cycle_state, save_cycle_state
+from .metrics import record_cycle_events
+from .state import MachineState, flush_cycle_state, load_cycle_state, save_cycle_state
 
 LOGGER = logging.getLogger(__name__)
 
 __all__ = ["CycleMonitor", "GPIOUnavailableError", "MonitorStats"]
 
+# Line terminator used for CSV and spool rows.  Matches ``csv.writer``'s
+# default so files written before and after remain consistent.
+_ROW_TERMINATOR = "\r\n"
+# Sidecar state record.  Matches ``json.dumps`` output for the same keys; ISO
+# timestamps never contain characters that need JSON escaping.
+_SIDECAR_TEMPLATE = b'{"last_cycle": %d, "last_timestamp": "%s"}'
+# Edge debounce window, shared by the GPIO driver and the software check in
+# ``CycleMonitor._handle_event``.
+_BOUNCE_TIME_MS = 200
+_DEBOUNCE_NS = _BOUNCE_TIME_MS * 1_000_000
+# Maximum buffers per ``os.writev`` call (POSIX guarantees at least 16; Linux
+# allows 1024).
+try:
+    _IOV_MAX = max(16, os.sysconf("SC_IOV_MAX"))
+except (AttributeError, OSError, ValueError):  # pragma: no cover - non-POSIX
+    _IOV_MAX = 16
+# Seconds between automatic cycle counter resets.
+_RESET_INTERVAL_SECONDS = 86400.0
+# Events between re-checks that the CSV still exists once storage is ready.
+_STORAGE_RECHECK_EVENTS = 16
+# Seconds between writer retries while rows wait in the spool for a busy CSV.
+_PENDING_RETRY_SECONDS = 5.0
+
 try:  # pragma: no cover - hardware-specific import
     import RPi.GPIO as GPIO  # type: ignore
 
@@ -49,7 +75,9 @@ class _CycleCounter:
     def __init__(self, reset_hour: int = 3):
         self._reset_hour = reset_hour
         self._count = 0
-        self._next_reset: Optional[datetime] = None
+        # Next reset as a POSIX timestamp so the per-event check is a single
+        # float comparison rather than an aware ``datetime`` comparison.
+        self._next_reset_epoch: Optional[float] = None
 
     def _calculate_next_reset(self, reference: datetime) -> datetime:
         cycle_reset = reference.replace(
@@ -63,17 +91,26 @@ class _CycleCounter:
         """Configure the counter based on an existing reference timestamp."""
 
         self._count = current_count
-        self._next_reset = self._calculate_next_reset(reference)
+        self._next_reset_epoch = self._calculate_next_reset(reference).timestamp()
+
+    def record(self, timestamp: datetime, ts_epoch: Optional[float] = None) -> int:
+        """Increment the cycle count for the given timestamp.
 
-    def record(self, timestamp: datetime) -> int:
-        """Increment the cycle count for the given timestamp."""
+        ``ts_epoch`` may be passed by callers that already know
+        ``timestamp.timestamp()``.
+        """
 
-        if self._next_reset is None:
-            self.configure(timestamp, self._count)
+        next_reset = self._next_reset_epoch
+        if next_reset is None:
+            next_reset = self._calculate_next_reset(timestamp).timestamp()
+        if ts_epoch is None:
+            ts_epoch = timestamp.timestamp()
 
-        while self._next_reset and timestamp >= self._next_reset:
+        if ts_epoch >= next_reset:
             self._count = 0
-            self._next_reset = self._next_reset + timedelta(days=1)
+            while ts_epoch >= next_reset:
+                next_reset += _RESET_INTERVAL_SECONDS
+        self._next_reset_epoch = next_reset
 
         self._count += 1
         return self._count
@@ -83,6 +120,86 @@ class _CycleCounter:
         return self._count
 
 
+def _write_all(fd: int, data: bytes) -> None:
+    """Write ``data`` to ``fd``, retrying short writes."""
+
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _write_buffers(fd: int, buffers: list[bytes]) -> None:
+    """Write ``buffers`` to ``fd`` without joining them first where possible."""
+
+    if not hasattr(os, "writev"):
+        _write_all(fd, b"".join(buffers))
+        return
+    for start in range(0, len(buffers), _IOV_MAX):
+        batch = buffers[start : start + _IOV_MAX]
+        written = os.writev(fd, batch)
+        if written < sum(map(len, batch)):
+            # Short vectored write; finish the rest of this batch directly.
+            _write_all(fd, b"".join(batch)[written:])
+
+
+class _HeldFile:
+    """A descriptor for ``path`` that is kept open and reused across writes.
+
+    The CSV and sidecar live on a shared drive where other machines may replace
+    or delete them, so the path's inode is checked each time the descriptor is
+    reused and the file is reopened when it no longer matches.  Callers hold
+    ``lock`` around :meth:`open`, the writes, and :meth:`close`.
+    """
+
+    def __init__(self, flags: int, mode: int):
+        self.lock = threading.Lock()
+        self._flags = flags | getattr(os, "O_CLOEXEC", 0)
+        self._mode = mode
+        self._path: Optional[Path] = None
+        self._fd: Optional[int] = None
+        self._inode: Optional[int] = None
+
+    def holds(self, path: Path) -> bool:
+        return self._fd is not None and self._path == path
+
+    def open(self, path: Path) -> tuple[int, bool]:
+        """Return a descriptor for ``path`` and whether it was newly opened."""
+
+        if self._fd is not None:
+            try:
+                current_inode: Optional[int] = os.stat(path).st_ino
+            except FileNotFoundError:
+                current_inode = None
+            if self._path != path or current_inode != self._inode:
+                LOGGER.info("File %s was replaced; reopening", path)
+                self.close()
+        if self._fd is not None:
+            return (self._fd, False)
+
+        fd = os.open(path, self._flags, self._mode)
+        try:
+            self._inode = os.fstat(fd).st_ino
+        except OSError:
+            os.close(fd)
+            raise
+        self._fd = fd
+        self._path = path
+        return (fd, True)
+
+    def close(self) -> None:
+        fd, path = self._fd, self._path
+        self._fd = None
+        self._path = None
+        self._inode = None
+        if fd is None:
+            return
+        try:
+            os.close(fd)
+        except OSError:
+            LOGGER.debug("Failed to close descriptor for %s", path, exc_info=True)
+
+
 class CycleMonitor:
     """Monitor a GPIO pin for rising edges and log cycle times."""
 
@@ -97,11 +214,29 @@ class CycleMonitor:
         self._csv_initialized = False
         self._pending_rows: list[list[str]] = []
         self._pending_loaded = False
-        self._write_queue: list[list[str]] = []
+        # Set once ``_prepare_storage`` succeeds; events then skip it and only
+        # re-check the CSV every ``_STORAGE_RECHECK_EVENTS`` events.
+        self._storage_ready = False
+        self._events_since_check = 0
+        # deque appends/pops are atomic, so producers never need ``_lock``.
+        self._write_queue: collections.deque[list[str]] = collections.deque()
+        # Event timestamps awaiting a batched metrics write by the next flush.
+        self._metrics_queue: collections.deque[datetime] = collections.deque()
         self._queue_event = threading.Event()
         self._writer_stop = threading.Event()
         self._writer_thread: Optional[threading.Thread] = None
         self._signal_high = False
+        self._last_edge_ns = 0
+        self._cached_paths: Optional[tuple[AppConfig, Path, Path, Path]] = None
+        # Latest (cycle, timestamp, timestamp_iso) awaiting persistence by the
+        # next flush; only the newest event of a batch is written.
+        self._latest_state: Optional[tuple[int, datetime, str]] = None
+        # Held from taking ``_latest_state`` until it is on disk, and across a
+        # manual reset, so an in-flight flush cannot overwrite a reset.
+        self._persist_lock = threading.Lock()
+        # Descriptors are only held open while the monitor is running.
+        self._csv_file = _HeldFile(os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o664)
+        self._sidecar_file = _HeldFile(os.O_WRONLY | os.O_CREAT, 0o660)
 
     @property
     def stats(self) -> MonitorStats:
@@ -111,7 +246,27 @@ class CycleMonitor:
     def csv_path(self) -> Path:
         """Return the CSV path associated with the current configuration."""
 
-        return self.config.csv_path()
+        return self._storage_paths()[0]
+
+    def _storage_paths(self) -> tuple[Path, Path, Path]:
+        """Return the CSV, spool and sidecar paths for the current config.
+
+        The paths are derived once per ``AppConfig`` instance; assigning a new
+        config to ``self.config`` invalidates them.
+        """
+
+        config = self.config
+        cached = self._cached_paths
+        if cached is None or cached[0] is not config:
+            csv_path = config.csv_path()
+            cached = (
+                config,
+                csv_path,
+                csv_path.with_name(csv_path.name + ".pending"),
+                csv_path.with_name(csv_path.name + ".state.json"),
+            )
+            self._cached_paths = cached
+        return cached[1], cached[2], cached[3]
 
     @property
     def is_running(self) -> bool:
@@ -231,6 +386,10 @@ class CycleMonitor:
 
         self._stop_writer_thread()
         self._flush_queue()
+        flush_cycle_state()
+        for held in (self._csv_file, self._sidecar_file):
+            with held.lock:
+                held.close()
 
     def _stop_writer_thread(self) -> None:
         thread = self._writer_thread
@@ -248,7 +407,10 @@ class CycleMonitor:
 
     def _writer_loop(self) -> None:  # pragma: no cover - background worker
         while not self._writer_stop.is_set():
-            self._queue_event.wait(timeout=5)
+            # Sleep until an event is queued; only poll while rows are waiting
+            # to be retried (or before the spool has been loaded).
+            idle = self._pending_loaded and not self._pending_rows
+            self._queue_event.wait(timeout=None if idle else _PENDING_RETRY_SECONDS)
             self._queue_event.clear()
             self._flush_queue()
         # Final flush after stop requested
@@ -258,18 +420,22 @@ class CycleMonitor:
         """Manually reset the cycle counter so the next event logs as cycle 1."""
 
         reference_time = (reference or datetime.now(timezone.utc)).astimezone()
-        with self._lock:
-            self._counter.configure(reference_time, 0)
-            self._counter_initialized = True
-        try:
-            save_cycle_state(
-                self.config.machine_id,
-                last_cycle=0,
-                last_timestamp=reference_time,
-            )
-        except Exception:  # pragma: no cover - best effort persistence
-            LOGGER.exception("Failed to persist manual reset state for %s", self.config.machine_id)
-        self._persist_sidecar_state(0, reference_time)
+        with self._persist_lock:
+            with self._lock:
+                self._counter.configure(reference_time, 0)
+                self._counter_initialized = True
+                # Drop any queued event state so a later flush cannot overwrite
+                # the reset.
+                self._latest_state = None
+            try:
+                save_cycle_state(
+                    self.config.machine_id,
+                    last_cycle=0,
+                    last_timestamp=reference_time,
+                )
+            except Exception:  # pragma: no cover - best effort persistence
+                LOGGER.exception("Failed to persist manual reset state for %s", self.config.machine_id)
+            self._persist_sidecar_state(0, reference_time)
         LOGGER.info(
             "Cycle counter manually reset; next cycle will start at 1 using %s as reference",
             reference_time.isoformat(),
@@ -328,7 +494,7 @@ class CycleMonitor:
                 pin,
                 GPIO.BOTH,
                 callback=self._handle_event,
-                bouncetime=200,
+                bouncetime=_BOUNCE_TIME_MS,
             )
         except RuntimeError as exc:
             # Occasionally the underlying GPIO driver refuses to register the
@@ -349,7 +515,7 @@ class CycleMonitor:
                     pin,
                     GPIO.BOTH,
                     callback=self._handle_event,
-                    bouncetime=200,
+                    bouncetime=_BOUNCE_TIME_MS,
                 )
             except Exception as final_exc:
                 raise RuntimeError(
@@ -368,10 +534,17 @@ class CycleMonitor:
                 self._signal_high = False
             return
 
+        now_ns = time.monotonic_ns()
         with self._lock:
             if self._signal_high:
                 return
             self._signal_high = True
+            # A rising edge this soon after the last accepted one is contact
+            # bounce that slipped past the driver; the line is high, so keep
+            # ``_signal_high`` set and let the next falling edge clear it.
+            if now_ns - self._last_edge_ns < _DEBOUNCE_NS:
+                return
+            self._last_edge_ns = now_ns
 
         timestamp = datetime.now(timezone.utc).astimezone()
         cycle_number = self._record_event(timestamp)
@@ -411,7 +584,7 @@ class CycleMonitor:
         return timestamp
 
     def _prepare_storage(self) -> None:
-        csv_path = self.config.csv_path()
+        csv_path = self.csv_path
         if self._csv_initialized:
             if not csv_path.exists():
                 LOGGER.warning("CSV file %s missing; reinitializing storage", csv_path)
@@ -419,6 +592,7 @@ class CycleMonitor:
             else:
                 if not self._pending_loaded:
                     self._load_pending_rows()
+                self._storage_ready = True
                 return
         try:
             Path(self.config.csv_directory).mkdir(parents=True, exist_ok=True)
@@ -439,6 +613,7 @@ class CycleMonitor:
                 self._counter.configure(reference, 0)
                 self._counter_initialized = True
             self._csv_initialized = True
+            self._storage_ready = True
             return
 
         seed = self._ensure_migrated(csv_path)
@@ -449,27 +624,14 @@ class CycleMonitor:
             self._counter.configure(reference.astimezone(), last_count)
             self._counter_initialized = True
 
-        last_timestamp: Optional[datetime] = None
-        last_count = 0
-        try:
-            with csv_path.open("r", newline="") as csv_file:
-                reader = csv.reader(csv_file)
-                row_count = 0
-                for row in reader:
-                    if len(row) < 1:
-                        continue
-                    try:
-                        timestamp = datetime.fromisoformat(row[0])
-                    except ValueError:
-                        continue
-                    last_timestamp = timestamp
-                    row_count += 1
-                last_count = row_count
-        except OSError:
-            LOGGER.exception("Failed to read existing CSV file %s", csv_path)
-            raise
-
+        # The CSV only seeds the counter when no persisted state was found, so
+        # skip reading it entirely in the common case.
         if not self._counter_initialized:
+            try:
+                last_timestamp, last_count = self._scan_csv(csv_path)
+            except OSError:
+                LOGGER.exception("Failed to read existing CSV file %s", csv_path)
+                raise
             reference = last_timestamp or datetime.now(timezone.utc).astimezone()
             if reference.tzinfo is None:
                 reference = reference.replace(tzinfo=timezone.utc)
@@ -478,113 +640,142 @@ class CycleMonitor:
         self._ensure_shared_permissions(csv_path)
         self._csv_initialized = True
         self._load_pending_rows()
+        self._storage_ready = True
         self._flush_queue()
 
+    @staticmethod
+    def _scan_csv(csv_path: Path) -> tuple[Optional[datetime], int]:
+        """Return the last logged timestamp and the number of valid rows in ``csv_path``.
+
+        Only rows whose first field parses as an ISO timestamp are counted, so
+        blank lines, headers or corrupt rows never inflate the seeded cycle
+        number. This runs only when no persisted state exists, so it reads the
+        file once, line by line, but parses each first field directly instead
+        of going through ``csv.reader``.
+        """
+
+        last_timestamp: Optional[datetime] = None
+        row_count = 0
+        parse = datetime.fromisoformat
+        with csv_path.open("rb") as csv_file:
+            for line in csv_file:
+                # Rows are written unquoted, so the first field is everything
+                # up to the first comma (or the line terminator).
+                field = line.split(b",", 1)[0].rstrip(b"\r\n")
+                if not field:
+                    continue
+                try:
+                    last_timestamp = parse(field.decode())
+                except (UnicodeDecodeError, ValueError):
+                    continue
+                row_count += 1
+        return (last_timestamp, row_count)
+
     def _ensure_migrated(self, csv_path: Path) -> Optional[tuple[datetime, int]]:
         try:
-            with csv_path.open("r", newline="") as csv_file:
-                reader = csv.reader(csv_file)
-                rows = list(reader)
+            csv_file = csv_path.open("rb")
         except OSError:
             LOGGER.exception("Failed to open CSV file %s for migration", csv_path)
             raise
 
-        if not rows:
-            reference = datetime.now(timezone.utc).astimezone()
-            return (reference, 0)
+        with csv_file:
+            first_line = csv_file.readline()
 
-        # Check if we need to migrate from old format (2 or 3 columns) to new format (1 column - timestamp only)
-        first_row = rows[0]
-        if len(first_row) == 1:
-            # Already in correct format (timestamp only)
-            return None
+            if not first_line:
+                reference = datetime.now(timezone.utc).astimezone()
+                return (reference, 0)
 
-        if len(first_row) in (2, 3):
-            # Migrate from old format to new format (timestamp only)
-            LOGGER.info("Migrating CSV file %s to timestamp-only format", csv_path)
-            counter = _CycleCounter()
-            migrated_rows = []
-            for row in rows:
-                if len(row) < 1:
-                    continue
-                # Timestamp is in the last column for all old formats
-                ts_str = row[-1]
-                try:
-                    timestamp = datetime.fromisoformat(ts_str)
-                except ValueError:
-                    continue
-                cycle_number = counter.record(timestamp)
-                migrated_rows.append([timestamp.isoformat()])
+            # Check if we need to migrate from old format (2 or 3 columns) to
+            # new format (1 column - timestamp only).  Only the first line is
+            # inspected so already-migrated files are never read in full.
+            separators = first_line.count(b",")
+            if separators == 0:
+                # Already in correct format (timestamp only)
+                return None
+
+            if separators > 2:
+                # Unknown format
+                return None
 
+            # Migrate from old format to new format (timestamp only), streaming
+            # rows into a temporary file so large logs never sit in memory.
+            LOGGER.info("Migrating CSV file %s to timestamp-only format", csv_path)
+            terminator = _ROW_TERMINATOR.encode()
+            tmp_path = csv_path.with_name(csv_path.name + ".migrating")
+            migrated_count = 0
+            last_field: Optional[bytes] = None
             try:
-                with csv_path.open("w", newline="") as csv_file:
-                    writer = csv.writer(csv_file)
-                    writer.writerows(migrated_rows)
+                with tmp_path.open("wb") as migrated_file:
+                    for line in itertools.chain((first_line,), csv_file):
+                        # Timestamp is in the last column for all old formats.
+                        # It is already ISO 8601, so copy it verbatim after a
+                        # cheap shape check instead of round-tripping through
+                        # datetime for every row.
+                        ts_bytes = line.rsplit(b",", 1)[-1].rstrip(b"\r\n")
+                        if len(ts_bytes) < 19 or ts_bytes[4] != 0x2D:  # "-"
+                            continue
+                        migrated_file.write(ts_bytes + terminator)
+                        migrated_count += 1
+                        last_field = ts_bytes
+                os.replace(tmp_path, csv_path)
             except OSError:
                 LOGGER.exception("Failed to migrate CSV file %s", csv_path)
-                raise
-
-            if migrated_rows:
-                ts_str = migrated_rows[-1][0]
                 try:
-                    last_timestamp = datetime.fromisoformat(ts_str)
-                except ValueError:
-                    last_timestamp = datetime.now(timezone.utc).astimezone()
-                return (last_timestamp, len(migrated_rows))
-            else:
-                reference = datetime.now(timezone.utc).astimezone()
-                return (reference, 0)
+                    tmp_path.unlink(missing_ok=True)  # type: ignore[arg-type]
+                except OSError:
+                    LOGGER.debug("Failed to remove temporary migration file %s", tmp_path, exc_info=True)
+                raise
 
-        # Unknown format
-        return None
+        if last_field is not None:
+            try:
+                return (datetime.fromisoformat(last_field.decode("ascii")), migrated_count)
+            except (UnicodeDecodeError, ValueError):
+                LOGGER.warning("Unable to parse last migrated timestamp in %s", csv_path)
+        reference = datetime.now(timezone.utc).astimezone()
+        return (reference, 0)
 
     def _record_event(self, timestamp: datetime) -> Optional[int]:
+        if self._storage_ready:
+            self._events_since_check += 1
+            if self._events_since_check >= _STORAGE_RECHECK_EVENTS:
+                self._events_since_check = 0
+                self._storage_ready = False
         try:
-            self._prepare_storage()
+            if not self._storage_ready:
+                self._prepare_storage()
         except Exception:
             LOGGER.exception("Unable to prepare storage for cycle events")
             return None
 
         cycle_number = self._counter.record(timestamp)
-        csv_path = self.config.csv_path()
-        row = [timestamp.isoformat()]
-        self._enqueue_row(row)
-        try:
-            save_cycle_state(
-                self.config.machine_id,
-                last_cycle=cycle_number,
-                last_timestamp=timestamp,
-            )
-        except Exception:  # pragma: no cover - best effort persistence
-            LOGGER.exception("Failed to persist cycle state for %s", self.config.machine_id)
-        self._persist_sidecar_state(cycle_number, timestamp)
-        try:
-            record_cycle_event(self.config.machine_id, timestamp)
-        except Exception:
-            LOGGER.exception("Failed to update cycle metrics for %s", self.config.machine_id)
+        # Serialize the timestamp once and share it with every store.  State is
+        # persisted by the flush that writes the row, once per batch.
+        timestamp_iso = timestamp.isoformat()
+        with self._lock:
+            self._latest_state = (cycle_number, timestamp, timestamp_iso)
+        self._metrics_queue.append(timestamp)
+        self._enqueue_row([timestamp_iso])
         return cycle_number
 
     # -----------------
     # Pending row logic
 
     def _enqueue_row(self, row: list[str]) -> None:
-        with self._lock:
-            if not self._pending_loaded:
+        if not self._pending_loaded:
+            with self._lock:
                 self._load_pending_rows()
-            self._write_queue.append(row)
-            running = self._running
+        self._write_queue.append(row)
 
-        if running:
+        if self._running:
             self._queue_event.set()
         else:
             if not self._flush_queue():
                 LOGGER.warning(
-                    "CSV file %s is busy; queued event at %s for retry", self.config.csv_path(), row[0]
+                    "CSV file %s is busy; queued event at %s for retry", self.csv_path, row[0]
                 )
 
     def _spool_path(self) -> Path:
-        csv_path = self.config.csv_path()
-        return csv_path.with_name(csv_path.name + ".pending")
+        return self._storage_paths()[1]
 
     def _load_pending_rows(self) -> None:
         if self._pending_loaded:
@@ -612,37 +803,83 @@ class CycleMonitor:
             return
         try:
             with spool_path.open("w", newline="") as spool_file:
-                writer = csv.writer(spool_file)
-                writer.writerows(self._pending_rows)
+                spool_file.write("".join(row[0] + _ROW_TERMINATOR for row in self._pending_rows))
             self._ensure_shared_permissions(spool_path, file_mode=0o664)
         except OSError:
             LOGGER.exception("Failed to persist pending events to %s", spool_path)
 
     def _flush_queue(self) -> bool:
-        csv_path = self.config.csv_path()
+        try:
+            return self._flush_rows()
+        finally:
+            self._persist_latest_state()
+            self._flush_metrics()
+
+    def _flush_metrics(self) -> None:
+        queue = self._metrics_queue
+        timestamps: list[datetime] = []
+        while True:
+            try:
+                timestamps.append(queue.popleft())
+            except IndexError:
+                break
+        if not timestamps:
+            return
+        try:
+            record_cycle_events(self.config.machine_id, timestamps)
+        except Exception:
+            LOGGER.exception("Failed to update cycle metrics for %s", self.config.machine_id)
+
+    def _persist_latest_state(self) -> None:
+        with self._persist_lock:
+            with self._lock:
+                latest = self._latest_state
+                self._latest_state = None
+            if latest is None:
+                return
+
+            cycle_number, timestamp, timestamp_iso = latest
+            try:
+                save_cycle_state(
+                    self.config.machine_id,
+                    last_cycle=cycle_number,
+                    last_timestamp=timestamp,
+                    last_timestamp_iso=timestamp_iso,
+                )
+            except Exception:  # pragma: no cover - best effort persistence
+                LOGGER.exception("Failed to persist cycle state for %s", self.config.machine_id)
+            self._persist_sidecar_state(cycle_number, timestamp, timestamp_iso=timestamp_iso)
+
+    def _flush_rows(self) -> bool:
+        csv_path = self.csv_path
         with self._lock:
             if not self._pending_loaded:
                 self._load_pending_rows()
-            if not self._pending_rows and not self._write_queue:
+            new_rows: list[list[str]] = []
+            queue = self._write_queue
+            while True:
+                try:
+                    new_rows.append(queue.popleft())
+                except IndexError:
+                    break
+            if not self._pending_rows and not new_rows:
                 return True
-            rows_to_write = [row[:] for row in self._pending_rows]
-            rows_to_write.extend(self._write_queue)
-            latest_row: Optional[list[str]] = None
-            if self._write_queue:
-                latest_row = self._write_queue[-1]
-            elif self._pending_rows:
-                latest_row = self._pending_rows[-1]
-            had_new_rows = bool(self._write_queue)
+            # Take ownership of the pending rows; the list is replaced below.
+            rows_to_write = self._pending_rows
+            rows_to_write.extend(new_rows)
+            latest_row = rows_to_write[-1]
+            had_new_rows = bool(new_rows)
             self._pending_rows = []
-            self._write_queue = []
+            keep_open = self._running
 
+        # Rows hold a single ISO timestamp, which never needs CSV quoting, so
+        # encode each one directly and hand the batch to a vectored write.
+        buffers = [(row[0] + _ROW_TERMINATOR).encode() for row in rows_to_write]
         try:
-            with csv_path.open("a", newline="") as csv_file:
-                writer = csv.writer(csv_file)
-                writer.writerows(rows_to_write)
+            self._append_to_csv(csv_path, buffers, keep_open=keep_open)
             self._ensure_shared_permissions(csv_path)
             self._persist_pending_rows()
-            if latest_row and had_new_rows:
+            if had_new_rows:
                 LOGGER.debug(
                     "Logged event at %s to %s", latest_row[0], csv_path
                 )
@@ -655,17 +892,31 @@ class CycleMonitor:
                 exc_info=True,
             )
             with self._lock:
+                # Rows queued while the write was in flight stay in the deque.
+                rows_to_write.extend(self._pending_rows)
                 self._pending_rows = rows_to_write
-                self._write_queue = []
             self._persist_pending_rows()
             return False
 
+    def _append_to_csv(self, csv_path: Path, buffers: list[bytes], *, keep_open: bool) -> None:
+        """Append ``buffers`` to the CSV, reusing the held descriptor if possible."""
+
+        held = self._csv_file
+        with held.lock:
+            fd, _ = held.open(csv_path)
+            try:
+                _write_buffers(fd, buffers)
+            except OSError:
+                held.close()
+                raise
+            if not keep_open:
+                held.close()
+
     # -----------------
     # Sidecar state persistence
 
     def _state_sidecar_path(self) -> Path:
-        csv_path = self.config.csv_path()
-        return csv_path.with_name(csv_path.name + ".state.json")
+        return self._storage_paths()[2]
 
     def _load_sidecar_state(self) -> Optional[MachineState]:
         sidecar = self._state_sidecar_path()
@@ -692,24 +943,45 @@ class CycleMonitor:
             last_timestamp=timestamp,
         )
 
-    def _persist_sidecar_state(self, last_cycle: int, timestamp: datetime) -> None:
+    def _persist_sidecar_state(
+        self, last_cycle: int, timestamp: datetime, *, timestamp_iso: Optional[str] = None
+    ) -> None:
         sidecar = self._state_sidecar_path()
-        try:
-            sidecar.parent.mkdir(parents=True, exist_ok=True)
-        except OSError:
-            LOGGER.exception("Unable to create directory for sidecar state %s", sidecar)
+        held = self._sidecar_file
+        if not held.holds(sidecar):
+            try:
+                sidecar.parent.mkdir(parents=True, exist_ok=True)
+            except OSError:
+                LOGGER.exception("Unable to create directory for sidecar state %s", sidecar)
+                return
+
+        iso = timestamp_iso or timestamp.isoformat()
+        data = _SIDECAR_TEMPLATE % (int(last_cycle), iso.encode("ascii"))
+
+        if hasattr(os, "pwrite"):
+            # The record is far smaller than a page, so rewrite it in place
+            # instead of going through a temporary file, rename and chmod.
+            with held.lock:
+                try:
+                    fd, opened = held.open(sidecar)
+                    if opened:
+                        self._ensure_shared_permissions(sidecar, file_mode=0o660)
+                    os.pwrite(fd, data, 0)
+                    os.ftruncate(fd, len(data))
+                except OSError:
+                    held.close()
+                    LOGGER.exception("Failed to persist sidecar state to %s", sidecar)
+                    return
+                if not self._running:
+                    held.close()
             return
 
-        payload = {
-            "last_cycle": int(last_cycle),
-            "last_timestamp": timestamp.isoformat(),
-        }
         suffix = sidecar.suffix
         tmp_path = (
             sidecar.with_suffix(suffix + ".tmp") if suffix else sidecar.with_name(sidecar.name + ".tmp")
         )
         try:
-            tmp_path.write_text(json.dumps(payload))
+            tmp_path.write_bytes(data)
             tmp_path.replace(sidecar)
             self._ensure_shared_permissions(sidecar, file_mode=0o660)
         except OSError:
@@ -2,27 +2,83 @@
 
 from __future__ import annotations
 
+import http.client
 import json
 import logging
+import socket
 import subprocess
 import sys
+import threading
+import time
 import tkinter as tk
-import urllib.request
-import urllib.error
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
-from typing import Optional, Dict, Any
+from typing import Any, Callable, Dict, Optional, Union
 
 from .config import AppConfig, load_config, save_config
 from .gpio_monitor import CycleMonitor
 from .metrics import AVERAGE_WINDOWS, calculate_cycle_statistics
-from .state import load_cycle_state
+from .state import MachineState, get_state_path, load_cycle_state
 from .remote_supervisor.settings import get_settings, refresh_settings
 
+try:  # pragma: no cover - optional dependency
+    from pystemd.systemd1 import Unit as SystemdUnit  # type: ignore
+except Exception:  # pragma: no cover - pystemd is optional
+    SystemdUnit = None
+
+try:
+    from . import __version__ as _VERSION
+except Exception:  # pragma: no cover - metadata lookup
+    _VERSION = "development"
+
 LOGGER = logging.getLogger(__name__)
 
 
 SERVICE_NAME = "fw-cycle-monitor.service"
+REMOTE_SUPERVISOR_SERVICE = "fw-remote-supervisor.service"
+# Upper bound on how long a systemctl call may block the Tk thread.
+SYSTEMCTL_TIMEOUT = 2.0
+# How long to wait for the remote supervisor to report active after a restart.
+RESTART_CHECK_TIMEOUT = 5.0
+RESTART_CHECK_INTERVAL = 0.5
+# Status refresh interval; doubles up to the maximum while nothing changes.
+STATUS_REFRESH_MIN_MS = 5000
+STATUS_REFRESH_MAX_MS = 30000
+# Remote supervisor API timeouts (seconds) and statuses retried once.
+API_CONNECT_TIMEOUT = 1.0
+API_READ_TIMEOUT = 10.0
+API_RETRY_STATUSES = frozenset({502, 503})
+# Errors that mean a kept-alive connection was already closed by the server
+# before it answered, so the request can safely be sent again.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.NotConnected,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+# Checkbox toggles closer together than this are sent as one request.
+STACKLIGHT_SET_DEBOUNCE_MS = 150
+
+# JSON body (a dict, or bytes that are sent as-is) for API POST requests.
+RequestData = Union[Dict[str, Any], bytes]
+
+# (events logged, last event, last cycle time, averages by window) display strings.
+StatsSnapshot = tuple[str, str, str, Dict[int, str]]
+
+# Request bodies for the quick-action buttons, encoded once.
+_QUICK_SET_BODIES: Dict[tuple[bool, bool, bool], bytes] = {
+    pattern: json.dumps(dict(zip(("green", "amber", "red"), pattern))).encode("utf-8")
+    for pattern in ((True, False, False), (False, True, False), (False, False, True))
+}
+
+
+@lru_cache(maxsize=512)
+def _format_hms(total_seconds: int) -> str:
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
 
 class Application(tk.Tk):
@@ -33,10 +89,34 @@ class Application(tk.Tk):
         self.title("FW Cycle Time Monitor")
         self.resizable(False, False)
 
+        style = ttk.Style(self)
+        style.configure("Secondary.TLabel", foreground="#555555")
+        style.configure("Hint.TLabel", foreground="#777777", font=("TkDefaultFont", 8))
+
         self._config = load_config()
         self._status_job: Optional[str] = None
+        self._refresh_interval = STATUS_REFRESH_MIN_MS
+        self._last_refresh_fingerprint: Optional[tuple[str, Optional[str], Optional[str]]] = None
+        self._service_state = ""
+        # D-Bus handle for the service unit when pystemd is installed; lets
+        # status polls read ActiveState without forking systemctl.
+        self._service_unit: Optional[Any] = None
+        self._service_unit_failed = SystemdUnit is None
         self._api_base_url: Optional[str] = None
         self._api_key: Optional[str] = None
+        # Request headers, built once when the API key is known.
+        self._get_headers: Dict[str, str] = {}
+        self._post_headers: Dict[str, str] = {}
+        self._api_address: Optional[tuple[str, int]] = None
+        self._stacklight_ready_text = "Ready (API mode)"
+        # Kept open between requests so polling and button clicks reuse one
+        # keep-alive connection to the remote supervisor.
+        self._api_connection: Optional[http.client.HTTPConnection] = None
+        # Guards ``_api_connection``; API requests run on the I/O pool.
+        self._api_lock = threading.RLock()
+        # Network and subprocess work runs here so the Tk main loop never
+        # blocks; results are handed back to the main thread with ``after``.
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gui-io")
 
         self._machine_var = tk.StringVar(value=self._config.machine_id)
         self._pin_var = tk.StringVar(value=str(self._config.gpio_pin))
@@ -47,18 +127,34 @@ class Application(tk.Tk):
         self._events_logged_var = tk.StringVar(value="0")
         self._last_cycle_time_var = tk.StringVar(value="—")
         self._cycle_average_vars = {minutes: tk.StringVar(value="—") for minutes in AVERAGE_WINDOWS}
+        # Last value written to each status variable, keyed by Tcl variable
+        # name, so periodic refreshes skip sets (and redraws) that change nothing.
+        self._var_values: Dict[str, str] = {}
+        # (machine_id, state file signature, state) from the last state read;
+        # reused while state.json is unchanged.
+        self._state_cache: Optional[tuple[str, tuple[int, int], Optional[MachineState]]] = None
+        # Incremented per stats refresh so results from older refreshes that
+        # finish late are dropped.
+        self._stats_generation = 0
 
         # Stack light status variables
         self._stacklight_status_var = tk.StringVar(value="Not initialized")
         self._stacklight_green_var = tk.BooleanVar(value=False)
         self._stacklight_amber_var = tk.BooleanVar(value=False)
         self._stacklight_red_var = tk.BooleanVar(value=False)
+        # Pending debounced /stacklight/set request for checkbox toggles.
+        self._pending_set_job: Optional[str] = None
 
         self._build_widgets()
         self.protocol("WM_DELETE_WINDOW", self._on_close)
         self._refresh_service_status()
         self._schedule_status_refresh()
-        self._initialize_stacklight_api()
+        # Show the core controls first; the stack light section and its API
+        # probe are set up once the window has been drawn.
+        self._deferred_jobs = [
+            self.after_idle(self._build_stacklight_section),
+            self.after(50, self._initialize_stacklight_api),
+        ]
 
     # UI Construction -------------------------------------------------
     def _build_widgets(self) -> None:
@@ -97,35 +193,33 @@ class Application(tk.Tk):
         status_frame = ttk.LabelFrame(frame, text="Status", padding=12)
         status_frame.grid(row=5, column=0, columnspan=3, pady=(16, 0), sticky="ew")
 
-        ttk.Label(status_frame, text="State:").grid(row=0, column=0, sticky="w")
-        ttk.Label(status_frame, textvariable=self._status_var).grid(row=0, column=1, sticky="w")
-
-        ttk.Label(status_frame, text="Last Event:").grid(row=1, column=0, sticky="w", pady=(8, 0))
-        ttk.Label(status_frame, textvariable=self._last_event_var).grid(row=1, column=1, sticky="w", pady=(8, 0))
-
-        ttk.Label(status_frame, text="Events Logged:").grid(row=2, column=0, sticky="w", pady=(8, 0))
-        ttk.Label(status_frame, textvariable=self._events_logged_var).grid(row=2, column=1, sticky="w", pady=(8, 0))
-
-        ttk.Label(status_frame, text="Last Cycle Time:").grid(row=3, column=0, sticky="w", pady=(8, 0))
-        ttk.Label(status_frame, textvariable=self._last_cycle_time_var).grid(
-            row=3, column=1, sticky="w", pady=(8, 0)
+        status_rows: list[tuple[str, tk.StringVar]] = [
+            ("State:", self._status_var),
+            ("Last Event:", self._last_event_var),
+            ("Events Logged:", self._events_logged_var),
+            ("Last Cycle Time:", self._last_cycle_time_var),
+        ]
+        status_rows.extend(
+            (f"Average ({minutes} min):", self._cycle_average_vars[minutes]) for minutes in AVERAGE_WINDOWS
         )
+        for row, (label, variable) in enumerate(status_rows):
+            pady = (8, 0) if row else 0
+            ttk.Label(status_frame, text=label).grid(row=row, column=0, sticky="w", pady=pady)
+            ttk.Label(status_frame, textvariable=variable).grid(row=row, column=1, sticky="w", pady=pady)
 
-        for index, minutes in enumerate(AVERAGE_WINDOWS, start=4):
-            ttk.Label(status_frame, text=f"Average ({minutes} min):").grid(
-                row=index, column=0, sticky="w", pady=(8, 0)
-            )
-            ttk.Label(status_frame, textvariable=self._cycle_average_vars[minutes]).grid(
-                row=index, column=1, sticky="w", pady=(8, 0)
-            )
+        ttk.Label(frame, text=f"Version: {_VERSION}", style="Secondary.TLabel").grid(
+            row=7, column=0, columnspan=3, sticky="w", pady=(16, 0)
+        )
+        self._main_frame = frame
 
+    def _build_stacklight_section(self) -> None:
         # Stack Light Control Section
-        stacklight_frame = ttk.LabelFrame(frame, text="Stack Light Control", padding=12)
+        stacklight_frame = ttk.LabelFrame(self._main_frame, text="Stack Light Control", padding=12)
         stacklight_frame.grid(row=6, column=0, columnspan=3, pady=(16, 0), sticky="ew")
 
         # Status row
         ttk.Label(stacklight_frame, text="Status:").grid(row=0, column=0, sticky="w")
-        ttk.Label(stacklight_frame, textvariable=self._stacklight_status_var, foreground="#555555").grid(
+        ttk.Label(stacklight_frame, textvariable=self._stacklight_status_var, style="Secondary.TLabel").grid(
             row=0, column=1, columnspan=3, sticky="w"
         )
 
@@ -154,9 +248,8 @@ class Application(tk.Tk):
         stacklight_button_frame = ttk.Frame(stacklight_frame)
         stacklight_button_frame.grid(row=2, column=0, columnspan=4, pady=(12, 0), sticky="ew")
 
-        ttk.Button(stacklight_button_frame, text="Test Sequence", command=self._test_stacklight).grid(
-            row=0, column=0, padx=(0, 8)
-        )
+        self._test_button = ttk.Button(stacklight_button_frame, text="Test Sequence", command=self._test_stacklight)
+        self._test_button.grid(row=0, column=0, padx=(0, 8))
         ttk.Button(stacklight_button_frame, text="All Off", command=self._turn_off_all_stacklights).grid(
             row=0, column=1, padx=(0, 8)
         )
@@ -180,15 +273,10 @@ class Application(tk.Tk):
         ttk.Button(stacklight_reload_frame, text="Restart Remote Supervisor", command=self._restart_remote_supervisor).grid(
             row=0, column=1, padx=(0, 8)
         )
-        ttk.Label(stacklight_reload_frame, text="(Reload GUI config or restart API service)", foreground="#777777", font=("TkDefaultFont", 8)).grid(
+        ttk.Label(stacklight_reload_frame, text="(Reload GUI config or restart API service)", style="Hint.TLabel").grid(
             row=0, column=2, padx=(8, 0), sticky="w"
         )
 
-        version = self._resolve_version()
-        ttk.Label(frame, text=f"Version: {version}", foreground="#555555").grid(
-            row=7, column=0, columnspan=3, sticky="w", pady=(16, 0)
-        )
-
     # Actions ---------------------------------------------------------
     def _select_directory(self) -> None:
         selected = filedialog.askdirectory(title="Select CSV Directory", initialdir=self._directory_var.get())
@@ -210,7 +298,9 @@ class Application(tk.Tk):
         self._status_var.set("Starting…")
         self._start_button.configure(state=tk.DISABLED)
         self._stop_button.configure(state=tk.DISABLED)
+        self._state_cache = None
         self._refresh_cycle_stats()
+        self._refresh_interval = STATUS_REFRESH_MIN_MS
         self._schedule_status_refresh(delay=1000)
 
     def _stop_monitor(self) -> None:
@@ -219,6 +309,8 @@ class Application(tk.Tk):
         self._status_var.set("Stopping…")
         self._start_button.configure(state=tk.DISABLED)
         self._stop_button.configure(state=tk.DISABLED)
+        self._state_cache = None
+        self._refresh_interval = STATUS_REFRESH_MIN_MS
         self._schedule_status_refresh(delay=1000)
 
     def _log_test_event(self) -> None:
@@ -239,8 +331,10 @@ class Application(tk.Tk):
             messagebox.showerror("Error", f"Failed to log test event: {exc}", parent=self)
             return
 
-        self._last_event_var.set(timestamp.isoformat())
+        self._set_var(self._last_event_var, timestamp.isoformat())
+        self._state_cache = None
         self._refresh_cycle_stats()
+        self._reset_refresh_interval()
 
     def _apply_config(self) -> None:
         try:
@@ -261,10 +355,17 @@ class Application(tk.Tk):
             result = subprocess.run(
                 ["systemctl", action, SERVICE_NAME],
                 check=False,
+                stdin=subprocess.DEVNULL,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
+                timeout=SYSTEMCTL_TIMEOUT,
             )
+        except subprocess.TimeoutExpired:
+            # systemd keeps running the queued job after the client gives up;
+            # the status refresh reports how it finishes.
+            LOGGER.warning("systemctl %s %s is still running; not waiting for it", action, SERVICE_NAME)
+            return True
         except FileNotFoundError:
             messagebox.showerror(
                 "Service control unavailable",
@@ -291,14 +392,22 @@ class Application(tk.Tk):
         return True
 
     def _query_service_state(self) -> str:
+        state = self._read_unit_active_state()
+        if state is not None:
+            return state
         try:
             result = subprocess.run(
                 ["systemctl", "is-active", SERVICE_NAME],
                 check=False,
+                stdin=subprocess.DEVNULL,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
+                timeout=SYSTEMCTL_TIMEOUT,
             )
+        except subprocess.TimeoutExpired:
+            LOGGER.warning("Timed out querying %s state", SERVICE_NAME)
+            return "unknown"
         except FileNotFoundError:
             return "unavailable"
         except Exception:  # pragma: no cover - defensive logging
@@ -314,8 +423,26 @@ class Application(tk.Tk):
             return "inactive"
         return "unknown"
 
+    def _read_unit_active_state(self) -> Optional[str]:
+        """Return the unit's ActiveState over D-Bus, or ``None`` to fall back to systemctl."""
+        if self._service_unit_failed:
+            return None
+        try:
+            if self._service_unit is None:
+                unit = SystemdUnit(SERVICE_NAME.encode())  # type: ignore[misc]
+                unit.load()
+                self._service_unit = unit
+            state = self._service_unit.Unit.ActiveState
+        except Exception:
+            LOGGER.debug("Unable to read %s state over D-Bus; using systemctl", SERVICE_NAME, exc_info=True)
+            self._service_unit = None
+            self._service_unit_failed = True
+            return None
+        return state.decode() if isinstance(state, bytes) else str(state)
+
     def _refresh_service_status(self) -> None:
         state = self._query_service_state()
+        self._service_state = state
         if state == "active":
             self._status_var.set("Running")
             self._start_button.configure(state=tk.DISABLED)
@@ -343,46 +470,99 @@ class Application(tk.Tk):
 
         self._refresh_cycle_stats()
 
-    def _schedule_status_refresh(self, delay: int = 5000) -> None:
+    def _schedule_status_refresh(self, delay: Optional[int] = None) -> None:
         if self._status_job is not None:
             self.after_cancel(self._status_job)
-        self._status_job = self.after(delay, self._periodic_refresh)
+        self._status_job = self.after(self._refresh_interval if delay is None else delay, self._periodic_refresh)
 
     def _periodic_refresh(self) -> None:
         self._status_job = None
         self._refresh_service_status()
+        fingerprint = (
+            self._service_state,
+            self._var_values.get(str(self._events_logged_var)),
+            self._var_values.get(str(self._last_event_var)),
+        )
+        if fingerprint == self._last_refresh_fingerprint:
+            self._refresh_interval = min(self._refresh_interval * 2, STATUS_REFRESH_MAX_MS)
+        else:
+            self._refresh_interval = STATUS_REFRESH_MIN_MS
+        self._last_refresh_fingerprint = fingerprint
         self._schedule_status_refresh()
 
+    def _reset_refresh_interval(self) -> None:
+        """Return to the fastest refresh rate after user activity."""
+        if self._refresh_interval != STATUS_REFRESH_MIN_MS:
+            self._refresh_interval = STATUS_REFRESH_MIN_MS
+            self._schedule_status_refresh()
+
     def _refresh_cycle_stats(self) -> None:
+        """Refresh the cycle statistics, reading state and metrics on the I/O pool."""
         machine_id = self._machine_var.get().strip().upper()
+        self._stats_generation += 1
         if not machine_id:
-            self._events_logged_var.set("0")
-            self._last_event_var.set("—")
-            self._last_cycle_time_var.set("—")
-            for var in self._cycle_average_vars.values():
-                var.set("—")
+            self._apply_stats_snapshot(("0", "—", "—", {minutes: "—" for minutes in AVERAGE_WINDOWS}))
             return
 
-        state = load_cycle_state(machine_id)
+        generation = self._stats_generation
+        self._run_in_background(
+            self._compute_stats_snapshot,
+            machine_id,
+            callback=lambda snapshot: self._apply_stats_snapshot(snapshot, generation),
+        )
+
+    def _compute_stats_snapshot(self, machine_id: str) -> StatsSnapshot:
+        """Return (events logged, last event, last cycle, averages) display strings (I/O pool)."""
+        state = self._load_machine_state(machine_id)
         if state:
-            self._events_logged_var.set(str(state.last_cycle))
-            self._last_event_var.set(state.last_timestamp.isoformat())
+            events_logged = str(state.last_cycle)
+            last_event = state.last_timestamp.isoformat()
         else:
-            self._events_logged_var.set("0")
-            self._last_event_var.set("—")
+            events_logged = "0"
+            last_event = "—"
 
         stats = calculate_cycle_statistics(machine_id)
-        self._last_cycle_time_var.set(self._format_duration(stats.last_cycle_seconds))
+        averages = {
+            minutes: self._format_duration(stats.window_averages.get(minutes)) for minutes in AVERAGE_WINDOWS
+        }
+        return (events_logged, last_event, self._format_duration(stats.last_cycle_seconds), averages)
+
+    def _apply_stats_snapshot(self, snapshot: Optional[StatsSnapshot], generation: Optional[int] = None) -> None:
+        if snapshot is None or (generation is not None and generation != self._stats_generation):
+            # Failed, or superseded by a newer refresh.
+            return
+        events_logged, last_event, last_cycle, averages = snapshot
+        self._set_var(self._events_logged_var, events_logged)
+        self._set_var(self._last_event_var, last_event)
+        self._set_var(self._last_cycle_time_var, last_cycle)
         for minutes, var in self._cycle_average_vars.items():
-            var.set(self._format_duration(stats.window_averages.get(minutes)))
-    
+            self._set_var(var, averages[minutes])
+
+    def _load_machine_state(self, machine_id: str) -> Optional[MachineState]:
+        """Return ``load_cycle_state(machine_id)``, re-reading only when state.json changed."""
+        try:
+            stat = get_state_path().stat()
+            signature = (stat.st_ino, stat.st_mtime_ns)
+        except OSError:
+            signature = (0, 0)
+        cached = self._state_cache
+        if cached is not None and cached[0] == machine_id and cached[1] == signature:
+            return cached[2]
+        state = load_cycle_state(machine_id)
+        self._state_cache = (machine_id, signature, state)
+        return state
+
+    def _set_var(self, var: tk.StringVar, value: str) -> None:
+        """Set ``var`` only when ``value`` differs from what was last written."""
+        name = str(var)
+        if self._var_values.get(name) != value:
+            var.set(value)
+            self._var_values[name] = value
+
     def _format_duration(self, seconds: Optional[float]) -> str:
         if seconds is None:
             return "—"
-        total_seconds = int(round(seconds))
-        hours, remainder = divmod(total_seconds, 3600)
-        minutes, secs = divmod(remainder, 60)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+        return _format_hms(int(round(seconds)))
 
     def _read_config_from_ui(self) -> AppConfig:
         machine_id = self._machine_var.get().strip().upper()
@@ -409,14 +589,6 @@ class Application(tk.Tk):
             reset_hour=reset_hour,
         )
 
-    def _resolve_version(self) -> str:
-        try:
-            from . import __version__
-
-            return __version__
-        except Exception:  # pragma: no cover - metadata lookup
-            return "development"
-
     def _initialize_stacklight_api(self) -> None:
         """Initialize connection to stack light API."""
         try:
@@ -426,16 +598,21 @@ class Application(tk.Tk):
                 return
 
             # Get API configuration
+            self._close_api_connection()
+            self._api_address = (settings.host, settings.port)
             self._api_base_url = f"http://{settings.host}:{settings.port}"
             if settings.api_keys and len(settings.api_keys) > 0:
                 self._api_key = settings.api_keys[0]
+                self._get_headers = {"X-API-Key": self._api_key}
+                self._post_headers = {"X-API-Key": self._api_key, "Content-Type": "application/json"}
             else:
                 self._stacklight_status_var.set("Error: No API key configured")
                 LOGGER.error("No API key found in remote supervisor configuration")
                 return
 
             mode = "MOCK MODE" if settings.stacklight.mock_mode else "Hardware Mode"
-            self._stacklight_status_var.set(f"Ready (API mode - {mode})")
+            self._stacklight_ready_text = f"Ready (API mode - {mode})"
+            self._stacklight_status_var.set(self._stacklight_ready_text)
             self._refresh_stacklight_state()
             LOGGER.info(f"Stack light API initialized - connecting to {self._api_base_url}")
 
@@ -443,43 +620,174 @@ class Application(tk.Tk):
             LOGGER.error(f"Failed to initialize stack light API: {exc}", exc_info=True)
             self._stacklight_status_var.set(f"Error: {exc}")
 
-    def _api_request(self, endpoint: str, method: str = "GET", data: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    def _run_in_background(self, func: Callable[..., Any], *args: Any, callback: Callable[[Any], None]) -> None:
+        """Run ``func`` on the I/O pool and pass its result to ``callback`` on the Tk thread."""
+        try:
+            future = self._io_pool.submit(func, *args)
+        except RuntimeError:  # pragma: no cover - pool shut down while closing
+            LOGGER.debug("Background task submitted after shutdown", exc_info=True)
+            return
+        future.add_done_callback(lambda done: self._deliver_result(done, callback))
+
+    def _deliver_result(self, future: Future, callback: Callable[[Any], None]) -> None:
+        try:
+            result = future.result()
+        except Exception:
+            LOGGER.exception("Background task failed")
+            result = None
+        try:
+            self.after(0, callback, result)
+        except (RuntimeError, tk.TclError):  # pragma: no cover - window already destroyed
+            LOGGER.debug("Dropping background result after the GUI closed", exc_info=True)
+
+    def _api_request_async(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        data: Optional[RequestData] = None,
+        *,
+        callback: Callable[[Optional[Dict[str, Any]]], None],
+    ) -> None:
+        """Make an API request off the Tk thread and hand the result to ``callback``."""
+        self._run_in_background(self._api_request_sync, endpoint, method, data, callback=callback)
+
+    def _api_request_sync(self, endpoint: str, method: str = "GET", data: Optional[RequestData] = None) -> Optional[Dict[str, Any]]:
         """Make an HTTP request to the remote supervisor API."""
-        if not self._api_base_url or not self._api_key:
+        with self._api_lock:
+            return self._api_request_locked(endpoint, method, data)
+
+    def _api_request_locked(self, endpoint: str, method: str, data: Optional[RequestData]) -> Optional[Dict[str, Any]]:
+        if not self._api_base_url or not self._api_key or not self._api_address:
             return None
 
-        url = f"{self._api_base_url}{endpoint}"
-        headers = {"X-API-Key": self._api_key}
+        if method == "GET":
+            headers = self._get_headers
+            body = None
+        else:
+            headers = self._post_headers
+            if isinstance(data, bytes):
+                body = data
+            else:
+                body = json.dumps(data).encode('utf-8') if data else None
 
         try:
-            if method == "GET":
-                req = urllib.request.Request(url, headers=headers)
-            else:  # POST
-                headers["Content-Type"] = "application/json"
-                json_data = json.dumps(data).encode('utf-8') if data else None
-                req = urllib.request.Request(url, data=json_data, headers=headers, method=method)
-
-            with urllib.request.urlopen(req, timeout=10) as response:
-                response_data = response.read().decode('utf-8')
-                return json.loads(response_data) if response_data else {}
-
-        except urllib.error.HTTPError as exc:
-            LOGGER.error(f"HTTP {exc.code} error from API {endpoint}: {exc.reason}")
-            return None
-        except urllib.error.URLError as exc:
-            LOGGER.error(f"URL error from API {endpoint}: {exc.reason}")
+            # Retry once, without delay, when the connection cannot be opened,
+            # when a kept-alive connection turns out to have been closed by the
+            # server while idle, or when the API is briefly unavailable.
+            # Anything else, in particular a read timeout, may mean the request
+            # was processed and is not retried, as POSTs are not idempotent.
+            retried = False
+            while True:
+                connection = self._api_connection
+                reused = connection is not None
+                if connection is None:
+                    try:
+                        connection = self._open_api_connection()
+                    except OSError:
+                        if retried:
+                            raise
+                        retried = True
+                        continue
+                try:
+                    response = self._send_api_request(connection, method, endpoint, body, headers)
+                except (http.client.HTTPException, OSError) as exc:
+                    # The GUI swapped the connection out (closing or reloading
+                    # settings); the request may have reached the server, so
+                    # do not repeat it on a new connection.
+                    if self._api_connection is not connection:
+                        connection.close()
+                        raise
+                    self._close_api_connection()
+                    if not reused or retried or not isinstance(exc, _STALE_CONNECTION_ERRORS):
+                        raise
+                    retried = True
+                    continue
+                # The body must be read in full before the connection can be reused.
+                status, reason, response_data = response.status, response.reason, response.read()
+                if connection.sock is None and self._api_connection is connection:
+                    # The server closed the connection (``Connection: close``);
+                    # open a new one, with the read timeout, on the next request.
+                    self._api_connection = None
+                if status in API_RETRY_STATUSES and not retried:
+                    retried = True
+                    continue
+                break
+
+            if status >= 400:
+                LOGGER.error(f"HTTP {status} error from API {endpoint}: {reason}")
+                return None
+            return json.loads(response_data.decode('utf-8')) if response_data else {}
+
+        except (http.client.HTTPException, OSError) as exc:
+            self._close_api_connection()
+            LOGGER.error(f"Connection error from API {endpoint}: {exc}")
             return None
         except Exception as exc:
             LOGGER.error(f"Failed to make API request to {endpoint}: {exc}", exc_info=True)
             return None
 
+    def _open_api_connection(self) -> http.client.HTTPConnection:
+        host, port = self._api_address  # type: ignore[misc]
+        connection = http.client.HTTPConnection(host, port, timeout=API_CONNECT_TIMEOUT)
+        # Reconnects must go through here so the read timeout below is applied.
+        connection.auto_open = 0
+        try:
+            connection.connect()
+        except OSError:
+            connection.close()
+            raise
+        # Connect fast, but give slow operations such as the test sequence
+        # time to respond.
+        connection.sock.settimeout(API_READ_TIMEOUT)
+        self._api_connection = connection
+        return connection
+
+    def _send_api_request(
+        self,
+        connection: http.client.HTTPConnection,
+        method: str,
+        endpoint: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+    ) -> http.client.HTTPResponse:
+        connection.request(method, endpoint, body=body, headers=headers)
+        return connection.getresponse()
+
+    def _close_api_connection(self) -> None:
+        """Drop the kept-alive API connection without waiting on a request.
+
+        The Tk thread calls this too, so it never blocks on ``_api_lock``:
+        when a pool worker is mid-request the socket is only shut down, which
+        makes the worker fail fast and close the connection itself.
+        """
+        connection, self._api_connection = self._api_connection, None
+        if connection is None:
+            return
+        if self._api_lock.acquire(blocking=False):
+            try:
+                connection.close()
+            finally:
+                self._api_lock.release()
+            return
+        sock = connection.sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
     def _refresh_stacklight_state(self) -> None:
         """Refresh the UI to show current stack light state."""
         if not self._api_base_url or not self._api_key:
             return
 
+        self._api_request_async("/stacklight/status", callback=self._apply_stacklight_state)
+
+    def _apply_stacklight_state(self, state: Optional[Dict[str, Any]]) -> None:
+        if self._pending_set_job is not None:
+            # A toggle is about to be sent; don't overwrite the user's choice.
+            return
         try:
-            state = self._api_request("/stacklight/status")
             if state:
                 self._stacklight_green_var.set(state.get("green", False))
                 self._stacklight_amber_var.set(state.get("amber", False))
@@ -487,34 +795,40 @@ class Application(tk.Tk):
         except Exception as exc:
             LOGGER.error(f"Failed to refresh stack light state: {exc}", exc_info=True)
 
+    def _sync_stacklight_from_result(self, result: Dict[str, Any]) -> None:
+        """Show the light state returned by a successful action, fetching it only if absent."""
+        state = result.get("state")
+        if isinstance(state, dict):
+            self._apply_stacklight_state(state)
+        else:
+            self._refresh_stacklight_state()
+
     def _set_stacklight_from_ui(self) -> None:
-        """Set stack light state from checkbox values."""
+        """Set stack light state from checkbox values.
+
+        Toggles within ``STACKLIGHT_SET_DEBOUNCE_MS`` are coalesced into a
+        single request carrying the final checkbox state.
+        """
         if not self._api_base_url or not self._api_key:
             messagebox.showwarning("Stack Light", "API not initialized", parent=self)
             return
 
+        if self._pending_set_job is not None:
+            self.after_cancel(self._pending_set_job)
+        self._pending_set_job = self.after(STACKLIGHT_SET_DEBOUNCE_MS, self._flush_stacklight_set)
+        self._reset_refresh_interval()
+
+    def _flush_stacklight_set(self) -> None:
+        self._pending_set_job = None
         try:
             green = self._stacklight_green_var.get()
             amber = self._stacklight_amber_var.get()
             red = self._stacklight_red_var.get()
 
             data = {"green": green, "amber": amber, "red": red}
-            result = self._api_request("/stacklight/set", method="POST", data=data)
-
-            if result and result.get("success"):
-                self._refresh_stacklight_state()
-            elif result:
-                messagebox.showerror(
-                    "Stack Light Error",
-                    f"Failed to set lights: {result.get('error', 'Unknown error')}",
-                    parent=self
-                )
-            else:
-                messagebox.showerror(
-                    "Connection Error",
-                    "Failed to connect to remote supervisor API",
-                    parent=self
-                )
+            self._api_request_async(
+                "/stacklight/set", method="POST", data=data, callback=self._on_stacklight_set_result
+            )
         except Exception as exc:
             LOGGER.error(f"Failed to set stack light: {exc}", exc_info=True)
             messagebox.showerror("Error", f"Failed to control stack lights: {exc}", parent=self)
@@ -525,27 +839,27 @@ class Application(tk.Tk):
             messagebox.showwarning("Stack Light", "API not initialized", parent=self)
             return
 
-        try:
-            data = {"green": green, "amber": amber, "red": red}
-            result = self._api_request("/stacklight/set", method="POST", data=data)
+        data: RequestData
+        data = _QUICK_SET_BODIES.get((green, amber, red)) or {"green": green, "amber": amber, "red": red}
+        self._api_request_async(
+            "/stacklight/set", method="POST", data=data, callback=self._on_stacklight_set_result
+        )
 
-            if result and result.get("success"):
-                self._refresh_stacklight_state()
-            elif result:
-                messagebox.showerror(
-                    "Stack Light Error",
-                    f"Failed to set lights: {result.get('error', 'Unknown error')}",
-                    parent=self
-                )
-            else:
-                messagebox.showerror(
-                    "Connection Error",
-                    "Failed to connect to remote supervisor API",
-                    parent=self
-                )
-        except Exception as exc:
-            LOGGER.error(f"Failed to set stack light: {exc}", exc_info=True)
-            messagebox.showerror("Error", f"Failed to control stack lights: {exc}", parent=self)
+    def _on_stacklight_set_result(self, result: Optional[Dict[str, Any]]) -> None:
+        if result and result.get("success"):
+            self._sync_stacklight_from_result(result)
+        elif result:
+            messagebox.showerror(
+                "Stack Light Error",
+                f"Failed to set lights: {result.get('error', 'Unknown error')}",
+                parent=self
+            )
+        else:
+            messagebox.showerror(
+                "Connection Error",
+                "Failed to connect to remote supervisor API",
+                parent=self
+            )
 
     def _test_stacklight(self) -> None:
         """Run test sequence on stack lights."""
@@ -553,16 +867,16 @@ class Application(tk.Tk):
             messagebox.showwarning("Stack Light", "API not initialized", parent=self)
             return
 
-        try:
-            # Disable buttons during test
-            self._stacklight_status_var.set("Running test sequence...")
-            self.update()
-
-            result = self._api_request("/stacklight/test", method="POST")
+        # Disable the button during the test so it can't be queued twice
+        self._test_button.state(["disabled"])
+        self._stacklight_status_var.set("Running test sequence...")
+        self._api_request_async("/stacklight/test", method="POST", callback=self._on_stacklight_test_result)
 
+    def _on_stacklight_test_result(self, result: Optional[Dict[str, Any]]) -> None:
+        try:
             if result and result.get("success"):
                 self._stacklight_status_var.set(f"Test complete ({result.get('duration_seconds', 0)}s)")
-                self._refresh_stacklight_state()
+                self._sync_stacklight_from_result(result)
             elif result:
                 self._stacklight_status_var.set("Test failed")
                 messagebox.showerror(
@@ -582,9 +896,8 @@ class Application(tk.Tk):
             messagebox.showerror("Error", f"Test sequence failed: {exc}", parent=self)
         finally:
             # Restore status
-            settings = get_settings()
-            mode = "MOCK MODE" if settings.stacklight.mock_mode else "Hardware Mode"
-            self._stacklight_status_var.set(f"Ready (API mode - {mode})")
+            self._stacklight_status_var.set(self._stacklight_ready_text)
+            self._test_button.state(["!disabled"])
 
     def _turn_off_all_stacklights(self) -> None:
         """Turn off all stack lights."""
@@ -592,26 +905,23 @@ class Application(tk.Tk):
             messagebox.showwarning("Stack Light", "API not initialized", parent=self)
             return
 
-        try:
-            result = self._api_request("/stacklight/off", method="POST")
+        self._api_request_async("/stacklight/off", method="POST", callback=self._on_stacklight_off_result)
 
-            if result and result.get("success"):
-                self._refresh_stacklight_state()
-            elif result:
-                messagebox.showerror(
-                    "Stack Light Error",
-                    f"Failed to turn off lights: {result.get('error', 'Unknown error')}",
-                    parent=self
-                )
-            else:
-                messagebox.showerror(
-                    "Connection Error",
-                    "Failed to connect to remote supervisor API",
-                    parent=self
-                )
-        except Exception as exc:
-            LOGGER.error(f"Failed to turn off stack lights: {exc}", exc_info=True)
-            messagebox.showerror("Error", f"Failed to turn off stack lights: {exc}", parent=self)
+    def _on_stacklight_off_result(self, result: Optional[Dict[str, Any]]) -> None:
+        if result and result.get("success"):
+            self._sync_stacklight_from_result(result)
+        elif result:
+            messagebox.showerror(
+                "Stack Light Error",
+                f"Failed to turn off lights: {result.get('error', 'Unknown error')}",
+                parent=self
+            )
+        else:
+            messagebox.showerror(
+                "Connection Error",
+                "Failed to connect to remote supervisor API",
+                parent=self
+            )
 
     def _reload_stacklight_config(self) -> None:
         """Reload stack light configuration and reinitialize API connection."""
@@ -634,24 +944,27 @@ class Application(tk.Tk):
 
     def _restart_remote_supervisor(self) -> None:
         """Restart the remote supervisor service."""
-        try:
-            # Ask for confirmation
-            response = messagebox.askyesno(
-                "Restart Service",
-                "This will restart the fw-remote-supervisor service.\n\n"
-                "The API will be unavailable for a few seconds.\n\n"
-                "Continue?",
-                parent=self
-            )
+        # Ask for confirmation
+        response = messagebox.askyesno(
+            "Restart Service",
+            "This will restart the fw-remote-supervisor service.\n\n"
+            "The API will be unavailable for a few seconds.\n\n"
+            "Continue?",
+            parent=self
+        )
 
-            if not response:
-                return
+        if not response:
+            return
 
-            LOGGER.info("Restarting fw-remote-supervisor service...")
+        LOGGER.info("Restarting fw-remote-supervisor service...")
+        self._run_in_background(self._restart_remote_supervisor_job, callback=self._show_restart_result)
 
+    def _restart_remote_supervisor_job(self) -> Dict[str, Any]:
+        """Restart the remote supervisor and wait for it to report active (I/O pool)."""
+        try:
             # Restart the service (using sudo - sudoers configured for NOPASSWD)
             result = subprocess.run(
-                ["sudo", "systemctl", "restart", "fw-remote-supervisor.service"],
+                ["sudo", "systemctl", "restart", REMOTE_SUPERVISOR_SERVICE],
                 check=False,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
@@ -660,46 +973,31 @@ class Application(tk.Tk):
 
             if result.returncode != 0:
                 error_msg = result.stderr.strip() or result.stdout.strip() or "Unknown error"
-                LOGGER.error(f"Failed to restart fw-remote-supervisor: {error_msg}")
-                messagebox.showerror(
-                    "Restart Failed",
-                    f"Failed to restart fw-remote-supervisor service:\n{error_msg}\n\n"
-                    "You may need to run this with sudo permissions.",
-                    parent=self
-                )
-                return
-
-            # Wait a moment for service to start
-            import time
-            time.sleep(2)
-
-            # Check if service is running
-            check_result = subprocess.run(
-                ["sudo", "systemctl", "is-active", "fw-remote-supervisor.service"],
-                check=False,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-            )
-
-            service_state = check_result.stdout.strip()
-
-            if service_state == "active":
-                messagebox.showinfo(
-                    "Service Restarted",
-                    "The fw-remote-supervisor service has been restarted successfully.\n\n"
-                    "The API and dashboard can now use the updated configuration.",
-                    parent=self
+                return {"error": error_msg}
+
+            # Poll until the service is running instead of sleeping a fixed time
+            deadline = time.monotonic() + RESTART_CHECK_TIMEOUT
+            while True:
+                check_result = subprocess.run(
+                    ["sudo", "systemctl", "is-active", REMOTE_SUPERVISOR_SERVICE],
+                    check=False,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
                 )
-            else:
-                messagebox.showwarning(
-                    "Service Status Unknown",
-                    f"Service restart command completed, but status is: {service_state}\n\n"
-                    "Check the logs with: sudo journalctl -u fw-remote-supervisor -n 20",
-                    parent=self
-                )
-
+                service_state = check_result.stdout.strip()
+                if service_state == "active" or time.monotonic() >= deadline:
+                    return {"state": service_state}
+                time.sleep(RESTART_CHECK_INTERVAL)
         except FileNotFoundError:
+            return {"missing": True}
+        except Exception as exc:
+            LOGGER.error(f"Failed to restart remote supervisor: {exc}", exc_info=True)
+            return {"exception": exc}
+
+    def _show_restart_result(self, outcome: Optional[Dict[str, Any]]) -> None:
+        outcome = outcome or {"exception": "unknown error"}
+        if outcome.get("missing"):
             messagebox.showerror(
                 "systemctl not available",
                 "The systemctl command is not available.\n\n"
@@ -707,11 +1005,43 @@ class Application(tk.Tk):
                 "sudo systemctl restart fw-remote-supervisor",
                 parent=self
             )
-        except Exception as exc:
-            LOGGER.error(f"Failed to restart remote supervisor: {exc}", exc_info=True)
-            messagebox.showerror("Error", f"Failed to restart service: {exc}", parent=self)
+        elif "exception" in outcome:
+            messagebox.showerror("Error", f"Failed to restart service: {outcome['exception']}", parent=self)
+        elif "error" in outcome:
+            error_msg = outcome["error"]
+            LOGGER.error(f"Failed to restart fw-remote-supervisor: {error_msg}")
+            messagebox.showerror(
+                "Restart Failed",
+                f"Failed to restart fw-remote-supervisor service:\n{error_msg}\n\n"
+                "You may need to run this with sudo permissions.",
+                parent=self
+            )
+        elif outcome.get("state") == "active":
+            messagebox.showinfo(
+                "Service Restarted",
+                "The fw-remote-supervisor service has been restarted successfully.\n\n"
+                "The API and dashboard can now use the updated configuration.",
+                parent=self
+            )
+        else:
+            messagebox.showwarning(
+                "Service Status Unknown",
+                f"Service restart command completed, but status is: {outcome.get('state', '')}\n\n"
+                "Check the logs with: sudo journalctl -u fw-remote-supervisor -n 20",
+                parent=self
+            )
 
     def _on_close(self) -> None:
+        for job in self._deferred_jobs:
+            try:
+                self.after_cancel(job)
+            except Exception:  # pragma: no cover - job already ran
+                LOGGER.debug("Failed to cancel deferred startup job", exc_info=True)
+        self._deferred_jobs = []
+        if self._pending_set_job is not None:
+            self.after_cancel(self._pending_set_job)
+            self._pending_set_job = None
+
         if self._status_job is not None:
             try:
                 self.after_cancel(self._status_job)
@@ -719,7 +1049,9 @@ class Application(tk.Tk):
                 LOGGER.debug("Failed to cancel scheduled status refresh", exc_info=True)
             self._status_job = None
 
-        # No cleanup needed for API mode - remote supervisor handles GPIO
+        # No GPIO cleanup needed for API mode - remote supervisor handles GPIO
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self._close_api_connection()
         LOGGER.info("Closing GUI - stack light control via API remains active")
 
         self.destroy()
@@ -2,20 +2,57 @@
 
 from __future__ import annotations
 
-import json
+import atexit
 import logging
-from dataclasses import dataclass
+import os
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
 
-from .config import CONFIG_DIR, ensure_config_dir
+from .config import ensure_config_dir, fsync_directory, get_config_dir, json_dumps, json_loads
 
 LOGGER = logging.getLogger(__name__)
 
-METRICS_PATH = CONFIG_DIR / "metrics.json"
+# Append-only log of cycle events, one JSON record per line: ``{"m": ID,
+# "t": ISO timestamp}`` for an event or ``{"m": ID, "clear": true}`` to drop a
+# machine's history.  It is rewritten with only the retained events once it
+# grows past ``_COMPACT_BYTES``.
+_METRICS_NAME = "metrics.jsonl"
+# Whole-file JSON blob written by earlier versions; migrated on first use.
+_LEGACY_METRICS_NAME = "metrics.json"
 RETENTION_PERIOD = timedelta(hours=2)
+_RETENTION_SECONDS = RETENTION_PERIOD.total_seconds()
 AVERAGE_WINDOWS: tuple[int, ...] = (5, 15, 30, 60)
 
+_COMPACT_BYTES = 256 * 1024
+# Appends go to the page cache and are flushed to the SD card after this many
+# writes or seconds, whichever comes first; compaction always syncs.
+_FSYNC_EVENTS = 32
+_FSYNC_INTERVAL = 30.0
+
+
+def _metrics_path() -> Path:
+    return get_config_dir() / _METRICS_NAME
+
+
+def _legacy_metrics_path() -> Path:
+    return get_config_dir() / _LEGACY_METRICS_NAME
+
+
+def __getattr__(name: str) -> Any:
+    # ``METRICS_PATH``/``LEGACY_METRICS_PATH`` used to be computed at import
+    # time; keep them available but only resolve the config dir when requested.
+    if name == "METRICS_PATH":
+        return _metrics_path()
+    if name == "LEGACY_METRICS_PATH":
+        return _legacy_metrics_path()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 @dataclass
 class CycleMetrics:
@@ -33,125 +70,381 @@ class CycleStatistics:
     window_averages: Dict[int, Optional[float]]
 
 
-def _load_metrics_blob() -> Dict[str, Any]:
-    if not METRICS_PATH.exists():
-        return {}
+@dataclass
+class _LogState:
+    """Parsed timestamps per machine read from the first ``offset`` bytes of the log.
+
+    Each machine's list is kept sorted; logged events are parsed once and
+    reused by every later load until the log is replaced.  ``epochs`` holds
+    the same events as POSIX seconds, index for index, so statistics work on
+    plain floats without converting datetimes on every call.
+    """
+
+    inode: int
+    offset: int
+    machines: Dict[str, List[datetime]] = field(default_factory=dict)
+    epochs: Dict[str, List[float]] = field(default_factory=dict)
+
+
+@dataclass
+class _LogWriter:
+    """Append descriptor for the log, held open across events."""
+
+    fd: int
+    inode: int
+    last_sync: float
+    unsynced: int = 0
+
+
+_LOG_STATE: Optional[_LogState] = None
+_LOG_WRITER: Optional[_LogWriter] = None
+_LOG_LOCK = threading.RLock()
+_LEGACY_CHECKED = False
+
+
+def _apply_log_lines(state: _LogState, data: bytes) -> None:
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json_loads(line)
+        except ValueError:
+            LOGGER.debug("Skipping malformed metrics record %r", line)
+            continue
+        if not isinstance(record, dict):
+            continue
+        machine_id = record.get("m")
+        if not isinstance(machine_id, str):
+            continue
+        if record.get("clear"):
+            state.machines.pop(machine_id, None)
+            state.epochs.pop(machine_id, None)
+            continue
+        timestamp = _parse_timestamp(record.get("t"))
+        if timestamp is None:
+            continue
+        epoch = timestamp.timestamp()
+        timestamps = state.machines.setdefault(machine_id, [])
+        epochs = state.epochs.setdefault(machine_id, [])
+        # Events are logged in near-chronological order, so appending is the
+        # common case and only late arrivals pay for an insertion.
+        if not epochs or epoch >= epochs[-1]:
+            timestamps.append(timestamp)
+            epochs.append(epoch)
+        else:
+            index = bisect_right(epochs, epoch)
+            timestamps.insert(index, timestamp)
+            epochs.insert(index, epoch)
+
+
+def _read_log() -> _LogState:
+    """Return the sorted logged timestamps per machine.
+
+    Only bytes appended since the previous call are parsed; the file is read
+    from the start again when it was replaced (compacted) or truncated.  The
+    returned state is shared and must not be modified by callers.
+    """
+
+    global _LOG_STATE
+    _migrate_legacy_blob()
+    try:
+        with _metrics_path().open("rb") as log_file:
+            stat = os.fstat(log_file.fileno())
+            state = _LOG_STATE
+            if state is None or state.inode != stat.st_ino or stat.st_size < state.offset:
+                state = _LogState(inode=stat.st_ino, offset=0)
+            if stat.st_size > state.offset:
+                log_file.seek(state.offset)
+                chunk = log_file.read(stat.st_size - state.offset)
+                # Leave a partially written last line for the next read.
+                complete = chunk.rfind(b"\n") + 1
+                _apply_log_lines(state, chunk[:complete])
+                state.offset += complete
+    except FileNotFoundError:
+        _LOG_STATE = None
+        return _LogState(inode=0, offset=0)
+    except OSError as exc:
+        LOGGER.warning("Failed to read metrics file %s: %s", _metrics_path(), exc)
+        return _LogState(inode=0, offset=0)
+    _LOG_STATE = state
+    return state
+
+
+def _encode_records(records: Iterable[Dict[str, Any]]) -> bytes:
+    """Serialize ``records`` as newline-terminated compact JSON lines."""
+
+    return b"".join(json_dumps(record, compact=True) + b"\n" for record in records)
+
+
+def _log_writer() -> _LogWriter:
+    """Return the held append descriptor, reopening it if the log was replaced."""
+
+    global _LOG_WRITER
+    writer = _LOG_WRITER
+    if writer is not None:
+        try:
+            current_inode: Optional[int] = os.stat(_metrics_path()).st_ino
+        except FileNotFoundError:
+            current_inode = None
+        if current_inode == writer.inode:
+            return writer
+        _close_log_writer()
+
+    ensure_config_dir()
+    flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+    fd = os.open(_metrics_path(), flags, 0o644)
+    try:
+        inode = os.fstat(fd).st_ino
+    except OSError:
+        os.close(fd)
+        raise
+    writer = _LogWriter(fd=fd, inode=inode, last_sync=time.monotonic())
+    _LOG_WRITER = writer
+    return writer
+
+
+def _close_log_writer() -> None:
+    """Sync any pending appends and release the held descriptor."""
+
+    global _LOG_WRITER
+    writer, _LOG_WRITER = _LOG_WRITER, None
+    if writer is None:
+        return
     try:
-        return json.loads(METRICS_PATH.read_text())
-    except (json.JSONDecodeError, OSError) as exc:
-        LOGGER.warning("Failed to read metrics file %s: %s", METRICS_PATH, exc)
-        return {}
+        if writer.unsynced:
+            os.fsync(writer.fd)
+    except OSError:
+        LOGGER.debug("Failed to sync metrics file %s", _metrics_path(), exc_info=True)
+    finally:
+        try:
+            os.close(writer.fd)
+        except OSError:
+            LOGGER.debug("Failed to close metrics file %s", _metrics_path(), exc_info=True)
+
+
+atexit.register(_close_log_writer)
+
+
+def _append_records(records: Iterable[Dict[str, Any]]) -> None:
+    """Append ``records`` to the log in a single write, compacting it when large."""
+
+    _migrate_legacy_blob()
+    payload = memoryview(_encode_records(records))
+    try:
+        writer = _log_writer()
+        while payload:
+            payload = payload[os.write(writer.fd, payload):]
+        size = os.lseek(writer.fd, 0, os.SEEK_CUR)
+        writer.unsynced += 1
+        now = time.monotonic()
+        if writer.unsynced >= _FSYNC_EVENTS or now - writer.last_sync >= _FSYNC_INTERVAL:
+            os.fsync(writer.fd)
+            writer.unsynced = 0
+            writer.last_sync = now
+    except OSError:
+        LOGGER.exception("Unable to persist metrics to %s", _metrics_path())
+        _close_log_writer()
+        return
+    if size > _COMPACT_BYTES:
+        _compact_log()
+
 
+def _write_log(machines: Dict[str, List[datetime]]) -> bool:
+    """Atomically replace the log with ``machines``' histories."""
 
-def _save_metrics_blob(data: Dict[str, Any]) -> None:
+    global _LOG_STATE
     ensure_config_dir()
-    tmp_path = METRICS_PATH.with_suffix(METRICS_PATH.suffix + ".tmp")
+    payload = _encode_records(
+        {"m": machine_id, "t": timestamp.isoformat()}
+        for machine_id, timestamps in machines.items()
+        for timestamp in timestamps
+    )
+    metrics_path = _metrics_path()
+    tmp_path = metrics_path.with_suffix(metrics_path.suffix + ".tmp")
     try:
-        tmp_path.write_text(json.dumps(data, indent=2))
-        tmp_path.replace(METRICS_PATH)
+        with tmp_path.open("wb") as tmp_file:
+            tmp_file.write(payload)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        _close_log_writer()
+        tmp_path.replace(metrics_path)
+        fsync_directory(metrics_path.parent)
     except OSError:
-        LOGGER.exception("Unable to persist metrics to %s", METRICS_PATH)
+        LOGGER.exception("Unable to persist metrics to %s", metrics_path)
         try:
             tmp_path.unlink(missing_ok=True)  # type: ignore[arg-type]
         except OSError:
             LOGGER.debug("Failed to remove temporary metrics file %s", tmp_path, exc_info=True)
+        return False
+    _LOG_STATE = None
+    return True
+
+
+def _compact_log() -> None:
+    """Rewrite the log keeping only each machine's retained events."""
+
+    state = _read_log()
+    retained = {
+        machine_id: timestamps[_retained_start(state.epochs[machine_id]):]
+        for machine_id, timestamps in state.machines.items()
+    }
+    _write_log(retained)
+
 
+def _migrate_legacy_blob() -> None:
+    """Convert a ``metrics.json`` blob from earlier versions into the log, once per process."""
 
+    global _LEGACY_CHECKED
+    if _LEGACY_CHECKED:
+        return
+    _LEGACY_CHECKED = True
+    metrics_path = _metrics_path()
+    legacy_path = _legacy_metrics_path()
+    if metrics_path.exists() or not legacy_path.exists():
+        return
+    try:
+        data = json_loads(legacy_path.read_bytes())
+    except (ValueError, OSError) as exc:
+        LOGGER.warning("Failed to read legacy metrics file %s: %s", legacy_path, exc)
+        return
+    machines = data.get("machines") if isinstance(data, dict) else None
+    if not isinstance(machines, dict):
+        machines = {}
+    LOGGER.info("Migrating metrics from %s to %s", legacy_path, metrics_path)
+    if _write_log({machine_id: _parse_timestamps(values) for machine_id, values in machines.items()}):
+        try:
+            legacy_path.unlink()
+        except OSError:
+            LOGGER.debug("Failed to remove legacy metrics file %s", legacy_path, exc_info=True)
+
+
+@lru_cache(maxsize=64)
 def _canonical_machine_id(machine_id: str) -> str:
     return machine_id.strip().upper()
 
 
+def _retained_start(epochs: List[float]) -> int:
+    """Return the index of the first event within ``RETENTION_PERIOD`` of the newest.
+
+    At least the last two events are always retained.
+    """
+
+    if not epochs:
+        return 0
+    first = bisect_left(epochs, epochs[-1] - _RETENTION_SECONDS)
+    return min(first, max(len(epochs) - 2, 0))
+
+
 def load_cycle_metrics(machine_id: str) -> CycleMetrics:
     """Load stored timestamps for ``machine_id``."""
 
     canonical_id = _canonical_machine_id(machine_id)
-    data = _load_metrics_blob()
-    machines = data.get("machines")
-    if not isinstance(machines, dict):
-        machines = {}
-    raw_timestamps = machines.get(canonical_id, [])
+    with _LOG_LOCK:
+        state = _read_log()
+        timestamps = state.machines.get(canonical_id, [])
+        timestamps = timestamps[_retained_start(state.epochs.get(canonical_id, [])):]
+    return CycleMetrics(machine_id=canonical_id, timestamps=timestamps)
+
+
+def _load_cycle_epochs(canonical_id: str) -> List[float]:
+    """Return the retained events for ``canonical_id`` as sorted POSIX seconds."""
+
+    with _LOG_LOCK:
+        epochs = _read_log().epochs.get(canonical_id, [])
+        return epochs[_retained_start(epochs):]
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    """Return the timezone-aware timestamp stored as ISO string ``value``."""
+
+    if not isinstance(value, str):
+        return None
+    try:
+        timestamp = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp
+
+
+def _parse_timestamps(raw_timestamps: Any) -> List[datetime]:
+    """Return the sorted, timezone-aware timestamps stored in ``raw_timestamps``."""
+
     timestamps: List[datetime] = []
     if isinstance(raw_timestamps, list):
         for value in raw_timestamps:
-            if not isinstance(value, str):
-                continue
-            try:
-                timestamp = datetime.fromisoformat(value)
-            except ValueError:
-                continue
-            if timestamp.tzinfo is None:
-                timestamp = timestamp.replace(tzinfo=timezone.utc)
-            timestamps.append(timestamp)
+            timestamp = _parse_timestamp(value)
+            if timestamp is not None:
+                timestamps.append(timestamp)
     timestamps.sort()
-    return CycleMetrics(machine_id=canonical_id, timestamps=timestamps)
+    return timestamps
 
 
 def save_cycle_metrics(metrics: CycleMetrics) -> None:
-    """Persist ``metrics`` to disk."""
+    """Persist ``metrics`` to disk, replacing the stored history for its machine."""
 
     canonical_id = _canonical_machine_id(metrics.machine_id)
-    data = _load_metrics_blob()
-    machines = data.setdefault("machines", {})
-    if not isinstance(machines, dict):
-        machines = {}
-        data["machines"] = machines
-    machines[canonical_id] = [ts.isoformat() for ts in sorted(metrics.timestamps)]
-    _save_metrics_blob(data)
+    records: List[Dict[str, Any]] = [{"m": canonical_id, "clear": True}]
+    # Readers keep each machine's history sorted as records arrive, so the
+    # list is written as given rather than re-sorted here.
+    records.extend({"m": canonical_id, "t": ts.isoformat()} for ts in metrics.timestamps)
+    with _LOG_LOCK:
+        _append_records(records)
 
 
 def record_cycle_event(machine_id: str, timestamp: datetime) -> None:
     """Record a cycle event for ``machine_id`` at ``timestamp``."""
 
-    if timestamp.tzinfo is None:
-        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    record_cycle_events(machine_id, (timestamp,))
 
-    metrics = load_cycle_metrics(machine_id)
-    metrics.timestamps.append(timestamp)
-    metrics.timestamps.sort()
 
-    cutoff = timestamp - RETENTION_PERIOD
-    filtered = [ts for ts in metrics.timestamps if ts >= cutoff]
-    if len(filtered) < 2 and metrics.timestamps:
-        filtered = metrics.timestamps[-2:]
-    metrics.timestamps = filtered
+def record_cycle_events(machine_id: str, timestamps: Iterable[datetime]) -> None:
+    """Record several cycle events for ``machine_id`` with a single log write."""
 
-    save_cycle_metrics(metrics)
+    canonical_id = _canonical_machine_id(machine_id)
+    records = []
+    for timestamp in timestamps:
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        records.append({"m": canonical_id, "t": timestamp.isoformat()})
+    if not records:
+        return
+    with _LOG_LOCK:
+        _append_records(records)
 
 
 def clear_cycle_metrics(machine_id: str) -> None:
     """Remove stored metrics for ``machine_id``."""
 
     canonical_id = _canonical_machine_id(machine_id)
-    data = _load_metrics_blob()
-    machines = data.get("machines")
-    if not isinstance(machines, dict) or canonical_id not in machines:
-        return
-    machines.pop(canonical_id, None)
-    _save_metrics_blob(data)
+    with _LOG_LOCK:
+        if canonical_id not in _read_log().machines:
+            return
+        _append_records(({"m": canonical_id, "clear": True},))
 
 
 def calculate_cycle_statistics(machine_id: str, now: Optional[datetime] = None) -> CycleStatistics:
     """Calculate statistics for ``machine_id``."""
 
-    metrics = load_cycle_metrics(machine_id)
-    timestamps = metrics.timestamps
-    if now is None:
-        now = datetime.now(timezone.utc).astimezone()
+    epochs = _load_cycle_epochs(_canonical_machine_id(machine_id))
+    now_epoch = time.time() if now is None else now.timestamp()
 
     last_cycle: Optional[float] = None
-    if len(timestamps) >= 2:
-        last_cycle = (timestamps[-1] - timestamps[-2]).total_seconds()
+    if len(epochs) >= 2:
+        last_cycle = epochs[-1] - epochs[-2]
+
+    # Cycle ``i`` runs from ``epochs[i]`` to ``epochs[i + 1]``.  Events are
+    # sorted, so the cycles ending inside a window are a suffix found by
+    # bisection and their durations telescope to a single subtraction.
+    ends = epochs[1:]
 
     averages: Dict[int, Optional[float]] = {}
     for window in AVERAGE_WINDOWS:
-        cutoff = now - timedelta(minutes=window)
-        durations = [
-            (end - start).total_seconds()
-            for start, end in zip(timestamps, timestamps[1:])
-            if end >= cutoff
-        ]
-        if durations:
-            averages[window] = sum(durations) / len(durations)
+        first = bisect_left(ends, now_epoch - window * 60)
+        count = len(ends) - first
+        if count:
+            averages[window] = (epochs[-1] - epochs[first]) / count
         else:
             averages[window] = None
 
@@ -4,11 +4,21 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Dict, Optional
+import subprocess
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from fastapi import Depends, FastAPI, HTTPException, status
+from fastapi.responses import JSONResponse, Response
 
-from ..config import load_config
+try:  # pragma: no cover - optional speedup
+    import orjson  # noqa: F401
+except ImportError:  # pragma: no cover - executed when orjson is not installed
+    _RESPONSE_CLASS = JSONResponse
+else:
+    from fastapi.responses import ORJSONResponse as _RESPONSE_CLASS
+
+from ..config import AppConfig, get_config_path, load_config
 from ..metrics import calculate_cycle_statistics
 from .auth import require_api_key
 from .models import (
@@ -21,24 +31,146 @@ from .models import (
     StackLightState,
     SystemActionResponse,
 )
-from .service_control import ServiceCommandError, restart_service, start_service, status_summary, stop_service
+from .service_control import (
+    ServiceCommandError,
+    ServiceStatus,
+    restart_service,
+    start_service,
+    status_summary,
+    stop_service,
+)
 from .settings import get_settings, refresh_settings
-from .registration import register_in_background
+from .registration import close_client as close_registration_client, register_in_background
 from .stacklight_controller import StackLightController
 
 LOGGER = logging.getLogger(__name__)
 
-app = FastAPI(title="FW Cycle Monitor Remote Supervisor", version="1.0.0")
+app = FastAPI(
+    title="FW Cycle Monitor Remote Supervisor",
+    version="1.0.0",
+    default_response_class=_RESPONSE_CLASS,
+)
 
 # Global stack light controller instance
 _stacklight_controller: Optional[StackLightController] = None
+# Set to interrupt a running test sequence or self-test; explicit set/off
+# requests take priority over a sequence in progress.
+_sequence_cancel: Optional[asyncio.Event] = None
+_self_test_task: Optional[asyncio.Task] = None
+
+
+def _start_sequence() -> asyncio.Event:
+    """Cancel any running light sequence and return the event for a new one."""
+
+    global _sequence_cancel
+    _cancel_sequence()
+    _sequence_cancel = asyncio.Event()
+    return _sequence_cancel
+
+
+def _cancel_sequence() -> None:
+    if _sequence_cancel is not None:
+        _sequence_cancel.set()
+
+
+# Last loaded monitor configuration keyed by the config file's (inode, mtime_ns).
+_config_cache: Optional[Tuple[Optional[Tuple[int, int]], AppConfig]] = None
+
+
+# ``systemctl show`` results are reused for this long so bursts of polls from
+# the GUI and dashboards share a single subprocess call.
+STATUS_CACHE_TTL = 1.0
+
+_status_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+# Created on first use so it binds to the server's event loop.
+_status_lock: Optional[asyncio.Lock] = None
+
+
+async def _cached_status_summary() -> Dict[str, Any]:
+    """Return ``status_summary()``, coalescing callers within ``STATUS_CACHE_TTL``."""
+
+    global _status_cache, _status_lock
+
+    if _status_lock is None:
+        _status_lock = asyncio.Lock()
+    async with _status_lock:
+        cached = _status_cache
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        summary = await asyncio.to_thread(status_summary)
+        _status_cache = (time.monotonic() + STATUS_CACHE_TTL, summary)
+        return summary
+
+
+async def _run_service_action(action: Callable[[], ServiceStatus]) -> Dict[str, Any]:
+    """Run a start/stop/restart off the event loop and cache the status it returns.
+
+    The mutation helpers already query the unit after acting, so that status
+    becomes the response and the cached value without another query.
+    """
+
+    global _status_cache
+
+    _invalidate_status_cache()
+    try:
+        status_after = await asyncio.to_thread(action)
+    finally:
+        # Drop anything a concurrent poll cached while the action ran.
+        _invalidate_status_cache()
+    summary = status_summary(status=status_after)
+    _status_cache = (time.monotonic() + STATUS_CACHE_TTL, summary)
+    return summary
+
+
+def _invalidate_status_cache() -> None:
+    """Drop the cached status so the next read reflects a start/stop/restart."""
+
+    global _status_cache
+    _status_cache = None
+
+
+# Last payload and rendered body per endpoint for ``_prebuilt_response``.
+_response_cache: Dict[str, Tuple[Dict[str, Any], bytes]] = {}
+
+
+def _prebuilt_response(endpoint: str, payload: Dict[str, Any]) -> Response:
+    """Return ``payload`` as JSON, reusing the rendered body while it is unchanged.
+
+    Returning a ``Response`` skips FastAPI's ``response_model`` validation and
+    re-serialization; callers build payloads that already match the model.
+    """
+
+    cached = _response_cache.get(endpoint)
+    if cached is not None and cached[0] == payload:
+        return Response(content=cached[1], media_type="application/json")
+    response = _RESPONSE_CLASS(payload)
+    _response_cache[endpoint] = (payload, response.body)
+    return response
+
+
+def _current_config() -> AppConfig:
+    """Return the monitor configuration, re-reading it only when the file changes."""
+
+    global _config_cache
+
+    try:
+        stat = get_config_path().stat()
+        signature: Optional[Tuple[int, int]] = (stat.st_ino, stat.st_mtime_ns)
+    except OSError:
+        signature = None
+    cached = _config_cache
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    config = load_config()
+    _config_cache = (signature, config)
+    return config
 
 
 @app.get("/service/status", response_model=ServiceStatusResponse)
-async def get_status(_: str | None = Depends(require_api_key)) -> Dict[str, Any]:
+async def get_status(_: str | None = Depends(require_api_key)) -> Response:
     """Return the systemd unit status."""
 
-    return status_summary()
+    return _prebuilt_response("status", await _cached_status_summary())
 
 
 @app.post("/service/start", response_model=ServiceActionResponse)
@@ -46,12 +178,11 @@ async def start(_: str | None = Depends(require_api_key)) -> Dict[str, Any]:
     """Start the monitor service."""
 
     try:
-        summary = status_summary()
+        summary = await _cached_status_summary()
         if summary.get("active_state") == "active":
             LOGGER.info("Service already active; returning status without change")
             return {"action": "start", **summary}
-        start_service()
-        return {"action": "start", **status_summary()}
+        return {"action": "start", **await _run_service_action(start_service)}
     except ServiceCommandError as exc:
         LOGGER.error("Failed to start service: %s", exc, exc_info=True)
         raise HTTPException(
@@ -65,8 +196,7 @@ async def stop(_: str | None = Depends(require_api_key)) -> Dict[str, Any]:
     """Stop the monitor service."""
 
     try:
-        stop_service()
-        return {"action": "stop", **status_summary()}
+        return {"action": "stop", **await _run_service_action(stop_service)}
     except ServiceCommandError as exc:
         LOGGER.error("Failed to stop service: %s", exc, exc_info=True)
         raise HTTPException(
@@ -80,8 +210,7 @@ async def restart(_: str | None = Depends(require_api_key)) -> Dict[str, Any]:
     """Restart the monitor service."""
 
     try:
-        restart_service()
-        return {"action": "restart", **status_summary()}
+        return {"action": "restart", **await _run_service_action(restart_service)}
     except ServiceCommandError as exc:
         LOGGER.error("Failed to restart service: %s", exc, exc_info=True)
         raise HTTPException(
@@ -93,7 +222,6 @@ async def restart(_: str | None = Depends(require_api_key)) -> Dict[str, Any]:
 @app.post("/system/reboot", response_model=SystemActionResponse)
 async def reboot_system(_: str | None = Depends(require_api_key)) -> Dict[str, Any]:
     """Reboot the Raspberry Pi system."""
-    import subprocess
 
     try:
         LOGGER.warning("System reboot requested via API")
@@ -118,7 +246,7 @@ async def reboot_system(_: str | None = Depends(require_api_key)) -> Dict[str, A
 async def config(_: str | None = Depends(require_api_key)) -> Dict[str, Any]:
     """Return the currently active monitor configuration."""
 
-    config = load_config()
+    config = _current_config()
     return {
         "machine_id": config.machine_id,
         "gpio_pin": config.gpio_pin,
@@ -128,7 +256,7 @@ async def config(_: str | None = Depends(require_api_key)) -> Dict[str, Any]:
 
 
 @app.get("/metrics/summary", response_model=MetricsResponse)
-async def metrics(_: str | None = Depends(require_api_key)) -> Dict[str, Any]:
+async def metrics(_: str | None = Depends(require_api_key)) -> Response:
     """Return live cycle statistics for dashboards."""
 
     settings = get_settings()
@@ -138,13 +266,16 @@ async def metrics(_: str | None = Depends(require_api_key)) -> Dict[str, Any]:
             detail="Metrics collection disabled",
         )
 
-    config = load_config()
+    config = _current_config()
     statistics = calculate_cycle_statistics(config.machine_id)
-    return {
-        "machine_id": config.machine_id,
-        "last_cycle_seconds": statistics.last_cycle_seconds,
-        "window_averages": statistics.window_averages,
-    }
+    return _prebuilt_response(
+        "metrics",
+        {
+            "machine_id": config.machine_id,
+            "last_cycle_seconds": statistics.last_cycle_seconds,
+            "window_averages": statistics.window_averages,
+        },
+    )
 
 
 def _get_stacklight_controller() -> StackLightController:
@@ -184,6 +315,7 @@ async def set_stacklight(
 
     try:
         controller = _get_stacklight_controller()
+        _cancel_sequence()
         result = controller.set_light_state(
             green=request.green,
             amber=request.amber,
@@ -235,8 +367,7 @@ async def test_stacklight(_: str | None = Depends(require_api_key)) -> Dict[str,
 
     try:
         controller = _get_stacklight_controller()
-        result = controller.test_sequence()
-        return result
+        return await controller.test_sequence_async(cancel_event=_start_sequence())
     except HTTPException:
         raise
     except Exception as e:
@@ -253,6 +384,7 @@ async def turn_off_stacklight(_: str | None = Depends(require_api_key)) -> Dict[
 
     try:
         controller = _get_stacklight_controller()
+        _cancel_sequence()
         result = controller.turn_off_all()
 
         if result["success"]:
@@ -277,26 +409,32 @@ async def turn_off_stacklight(_: str | None = Depends(require_api_key)) -> Dict[
         ) from e
 
 
+async def _run_startup_self_test() -> None:
+    try:
+        LOGGER.info("Initializing stack light controller for startup self-test")
+        controller = _get_stacklight_controller()
+        result = await controller.startup_self_test_async(cancel_event=_start_sequence())
+
+        if result["success"]:
+            LOGGER.info(f"Stack light startup self-test completed: {result.get('message')}")
+        else:
+            LOGGER.warning(f"Stack light startup self-test failed: {result.get('error')}")
+    except Exception as e:
+        LOGGER.error(f"Failed to run stack light startup self-test: {e}", exc_info=True)
+
+
 @app.on_event("startup")
 async def startup_event():
     """Refresh settings cache and run startup self-test on startup."""
     LOGGER.info("Refreshing settings cache on startup")
     refresh_settings()
 
-    # Run startup self-test if stack lights are enabled
+    # Run startup self-test in the background if stack lights are enabled so
+    # the API serves requests while the lights cycle.
+    global _self_test_task
     settings = get_settings()
     if settings.stacklight.enabled and settings.stacklight.startup_self_test:
-        try:
-            LOGGER.info("Initializing stack light controller for startup self-test")
-            controller = _get_stacklight_controller()
-            result = controller.startup_self_test()
-
-            if result["success"]:
-                LOGGER.info(f"Stack light startup self-test completed: {result.get('message')}")
-            else:
-                LOGGER.warning(f"Stack light startup self-test failed: {result.get('error')}")
-        except Exception as e:
-            LOGGER.error(f"Failed to run stack light startup self-test: {e}", exc_info=True)
+        _self_test_task = asyncio.create_task(_run_startup_self_test())
 
     # Register with dashboard in the background (fire-and-forget)
     asyncio.create_task(register_in_background())
@@ -305,9 +443,19 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up resources on shutdown."""
-    global _stacklight_controller
+    global _stacklight_controller, _self_test_task
+
+    if _self_test_task is not None and not _self_test_task.done():
+        _self_test_task.cancel()
+        try:
+            await _self_test_task
+        except asyncio.CancelledError:
+            pass
+    _self_test_task = None
 
     if _stacklight_controller is not None:
         LOGGER.info("Cleaning up stack light controller on shutdown")
         _stacklight_controller.cleanup()
         _stacklight_controller = None
+
+    await close_registration_client()
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import hashlib
+import hmac
+from functools import lru_cache
+from typing import Sequence
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import APIKeyHeader
 
@@ -11,13 +16,35 @@ API_KEY_HEADER_NAME = "X-API-Key"
 _api_key_header = APIKeyHeader(name=API_KEY_HEADER_NAME, auto_error=False)
 
 
+def _digest(api_key: str) -> bytes:
+    return hashlib.sha256(api_key.encode("utf-8")).digest()
+
+
+@lru_cache(maxsize=4)
+def _key_digests(api_keys: tuple[str, ...]) -> frozenset[bytes]:
+    """Return the SHA-256 digests of the configured keys, computed once per key set."""
+
+    return frozenset(_digest(key) for key in api_keys)
+
+
+def _is_valid_key(api_key: str, api_keys: Sequence[str]) -> bool:
+    """Compare ``api_key`` against every configured key in constant time."""
+
+    provided = _digest(api_key)
+    valid = False
+    # Check every digest so the response time does not reveal which key matched.
+    for digest in _key_digests(tuple(api_keys)):
+        valid |= hmac.compare_digest(provided, digest)
+    return valid
+
+
 async def require_api_key(api_key: str | None = Depends(_api_key_header)) -> str | None:
     """Validate the provided API key when authentication is enabled."""
 
     settings = get_settings()
     if not settings.require_auth:
         return None
-    if api_key and api_key in settings.api_keys:
+    if api_key and _is_valid_key(api_key, settings.api_keys):
         return api_key
     raise HTTPException(
         status_code=status.HTTP_403_FORBIDDEN,
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from dataclasses import dataclass
 from pathlib import Path
@@ -11,8 +10,27 @@ from typing import Optional, Union
 
 import httpx
 
+from ..config import json_dumps, json_loads
+
 DEFAULT_BASE_URL = "https://localhost:8443"
 
+try:  # pragma: no cover - optional dependency of httpx[http2]
+    import h2  # noqa: F401
+except ImportError:  # pragma: no cover - executed when h2 is not installed
+    HTTP2_AVAILABLE = False
+else:
+    HTTP2_AVAILABLE = True
+
+# Subcommand name -> (HTTP method, endpoint).
+COMMANDS: dict[str, tuple[str, str]] = {
+    "status": ("GET", "/service/status"),
+    "start": ("POST", "/service/start"),
+    "stop": ("POST", "/service/stop"),
+    "restart": ("POST", "/service/restart"),
+    "config": ("GET", "/config"),
+    "metrics": ("GET", "/metrics/summary"),
+}
+
 
 @dataclass
 class CLISettings:
@@ -38,6 +56,10 @@ def build_parser() -> argparse.ArgumentParser:
     subparsers.add_parser("restart", help="Restart the remote service")
     subparsers.add_parser("config", help="Show the current monitor configuration")
     subparsers.add_parser("metrics", help="Show recent cycle metrics")
+    subparsers.add_parser(
+        "batch",
+        help="Read one command per line from stdin and run them over a single connection",
+    )
 
     return parser
 
@@ -72,7 +94,13 @@ def _make_client(settings: CLISettings) -> httpx.Client:
         verify = str(settings.verify)
     else:
         verify = settings.verify
-    return httpx.Client(base_url=settings.base_url, headers=headers, verify=verify, timeout=settings.timeout)
+    return httpx.Client(
+        base_url=settings.base_url,
+        headers=headers,
+        verify=verify,
+        timeout=settings.timeout,
+        http2=HTTP2_AVAILABLE,
+    )
 
 
 def _handle_response(response: httpx.Response) -> int:
@@ -80,32 +108,48 @@ def _handle_response(response: httpx.Response) -> int:
         sys.stderr.write(f"Error {response.status_code}: {response.text}\n")
         return 1
     try:
-        payload = response.json()
+        payload = json_loads(response.content)
     except ValueError:
         print(response.text)
         return 0
-    print(json.dumps(payload, indent=2))
+    print(json_dumps(payload).decode(), flush=True)
     return 0
 
 
+def _run_command(client: httpx.Client, command: str) -> int:
+    try:
+        method, endpoint = COMMANDS[command]
+    except KeyError:
+        raise RuntimeError(f"Unknown command {command}") from None
+    return _handle_response(client.request(method, endpoint))
+
+
+def _run_batch(client: httpx.Client) -> int:
+    """Run commands read from stdin, reusing ``client``'s connection for all of them."""
+
+    exit_code = 0
+    for line in sys.stdin:
+        command = line.strip()
+        if not command or command.startswith("#"):
+            continue
+        if command not in COMMANDS:
+            sys.stderr.write(f"Unknown command {command!r}\n")
+            exit_code = 1
+            continue
+        try:
+            exit_code = max(exit_code, _run_command(client, command))
+        except httpx.HTTPError as exc:
+            sys.stderr.write(f"Error running {command}: {exc}\n")
+            exit_code = 1
+    return exit_code
+
+
 def main(argv: Optional[list[str]] = None) -> int:
     cli_settings, args = parse_cli(argv)
     with _make_client(cli_settings) as client:
-        if args.command == "status":
-            response = client.get("/service/status")
-        elif args.command == "start":
-            response = client.post("/service/start")
-        elif args.command == "stop":
-            response = client.post("/service/stop")
-        elif args.command == "restart":
-            response = client.post("/service/restart")
-        elif args.command == "config":
-            response = client.get("/config")
-        elif args.command == "metrics":
-            response = client.get("/metrics/summary")
-        else:
-            raise RuntimeError(f"Unknown command {args.command}")
-    return _handle_response(response)
+        if args.command == "batch":
+            return _run_batch(client)
+        return _run_command(client, args.command)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -3,23 +3,174 @@
 from __future__ import annotations
 
 import asyncio
+import email.utils
 import logging
+import random
 import socket
-from typing import Optional
+import ssl
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Optional
 
-import httpx
+from ..config import json_dumps, load_config
+from .settings import RemoteSupervisorSettings, get_settings
 
-from ..config import load_config
-from .settings import get_settings
+if TYPE_CHECKING:  # pragma: no cover - httpx is imported lazily at runtime
+    import httpx
 
 LOGGER = logging.getLogger(__name__)
 
 _MAX_RETRIES = 3
 _INITIAL_BACKOFF_SECONDS = 5
+_BACKOFF_CAP_SECONDS = 60
+# Responses worth retrying; any other unexpected status is treated as permanent.
+_RETRIABLE_STATUSES = frozenset({408, 429})
 _REQUEST_TIMEOUT_SECONDS = 10
+_IP_TTL_SECONDS = 60
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Last detected (ip, monotonic time); the Pi's address rarely changes.
+_IP_CACHE: Optional[tuple[str, float]] = None
+
+# Shared by every attempt and re-registration so retries reuse the pooled
+# connection, DNS result and TLS session instead of handshaking again.
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+# One TLS context for the process so reconnects can resume TLS sessions
+# instead of httpx building a fresh context for ``verify=False``.
+_SSL_CONTEXT: Optional[ssl.SSLContext] = None
+
+# (settings, machine_id, url, payload) from the last registration. A new
+# settings object from ``refresh_settings`` or a changed machine id rebuilds it.
+_PRECOMPUTED: Optional[tuple[RemoteSupervisorSettings, str, str, dict[str, object]]] = None
+
+
+def _get_ssl_context() -> ssl.SSLContext:
+    """Return the shared TLS context for dashboard requests.
+
+    When ``ca_bundle`` is configured the dashboard certificate is verified
+    against it; otherwise verification stays disabled as before.
+    """
+
+    global _SSL_CONTEXT
+    if _SSL_CONTEXT is not None:
+        return _SSL_CONTEXT
+
+    ca_bundle = get_settings().ca_bundle
+    context: Optional[ssl.SSLContext] = None
+    if ca_bundle is not None:
+        try:
+            context = ssl.create_default_context(cafile=str(ca_bundle))
+        except (OSError, ssl.SSLError) as exc:
+            LOGGER.warning("Could not load CA bundle %s: %s; not verifying dashboard TLS", ca_bundle, exc)
+    if context is None:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    _SSL_CONTEXT = context
+    return context
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared dashboard client, creating it on first use."""
+
+    import httpx
+
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            verify=_get_ssl_context(),
+            timeout=_REQUEST_TIMEOUT_SECONDS,
+            limits=httpx.Limits(max_keepalive_connections=2, max_connections=4),
+        )
+    return _CLIENT
+
+
+async def close_client() -> None:
+    """Close the shared dashboard client, if one was created."""
+
+    global _CLIENT
+    client, _CLIENT = _CLIENT, None
+    if client is not None:
+        await client.aclose()
+
+
+def _is_retriable_status(status_code: int) -> bool:
+    return status_code in _RETRIABLE_STATUSES or 500 <= status_code < 600
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Return the delay requested by a ``Retry-After`` header, if any."""
+
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def _registration_request(
+    settings: RemoteSupervisorSettings, machine_id: str, local_ip: str
+) -> tuple[str, dict[str, object]]:
+    """Return the registration URL and payload, reusing them across calls."""
+
+    global _PRECOMPUTED
+    cached = _PRECOMPUTED
+    if cached is None or cached[0] is not settings or cached[1] != machine_id:
+        api_key = settings.api_keys[0] if settings.api_keys else ""
+        url = f"{settings.dashboard_url.rstrip('/')}/api/machines/register"
+        payload: dict[str, object] = {
+            "machineId": machine_id,
+            "ipAddress": local_ip,
+            "port": settings.port,
+            "apiKey": api_key,
+        }
+        _PRECOMPUTED = (settings, machine_id, url, payload)
+        return url, payload
+    payload = cached[3]
+    payload["ipAddress"] = local_ip
+    return cached[2], payload
+
+
+def invalidate_ip_cache() -> None:
+    """Forget the cached local IP, e.g. after a network change."""
+
+    global _IP_CACHE
+    _IP_CACHE = None
 
 
 def detect_local_ip() -> Optional[str]:
+    """Detect the RPi's IP address, reusing a result from the last ``_IP_TTL_SECONDS``."""
+
+    global _IP_CACHE
+    cached = _IP_CACHE
+    if cached is not None and time.monotonic() - cached[1] < _IP_TTL_SECONDS:
+        return cached[0]
+    ip = _probe_local_ip()
+    if ip:
+        _IP_CACHE = (ip, time.monotonic())
+    return ip
+
+
+async def detect_local_ip_async() -> Optional[str]:
+    """Async ``detect_local_ip`` that keeps socket and resolver calls off the event loop."""
+
+    cached = _IP_CACHE
+    if cached is not None and time.monotonic() - cached[1] < _IP_TTL_SECONDS:
+        return cached[0]
+    return await asyncio.get_running_loop().run_in_executor(None, detect_local_ip)
+
+
+def _probe_local_ip() -> Optional[str]:
     """Detect the RPi's IP address by opening a UDP socket.
 
     No data is sent -- the OS selects the appropriate outbound interface
@@ -56,32 +207,30 @@ async def register_with_dashboard() -> bool:
         LOGGER.debug("No dashboard_url configured; skipping registration")
         return False
 
+    # Deferred so importing this module, or running without a dashboard,
+    # never pays for loading httpx and its transport stack.
+    import httpx
+
     config = load_config()
-    local_ip = detect_local_ip()
+    local_ip = await detect_local_ip_async()
 
     if not local_ip:
         LOGGER.error("Cannot register: failed to detect local IP")
         return False
 
-    api_key = settings.api_keys[0] if settings.api_keys else ""
-
-    registration_url = f"{settings.dashboard_url.rstrip('/')}/api/machines/register"
-    payload = {
-        "machineId": config.machine_id,
-        "ipAddress": local_ip,
-        "port": settings.port,
-        "apiKey": api_key,
-    }
+    registration_url, payload = _registration_request(settings, config.machine_id, local_ip)
 
     LOGGER.info(
         "Registering with dashboard at %s as %s (%s:%s)",
         registration_url, config.machine_id, local_ip, settings.port,
     )
 
+    body = json_dumps(payload, compact=True)
+    client = _get_client()
     for attempt in range(1, _MAX_RETRIES + 1):
+        retry_after: Optional[float] = None
         try:
-            async with httpx.AsyncClient(verify=False, timeout=_REQUEST_TIMEOUT_SECONDS) as client:
-                response = await client.post(registration_url, json=payload)
+            response = await client.post(registration_url, content=body, headers=_JSON_HEADERS)
 
             if response.status_code == 200:
                 LOGGER.info("Successfully registered with dashboard: %s", response.json())
@@ -100,20 +249,32 @@ async def register_with_dashboard() -> bool:
                     config.machine_id,
                 )
                 return False
-            else:
+            elif _is_retriable_status(response.status_code):
                 LOGGER.warning(
                     "Dashboard registration attempt %d/%d returned HTTP %d: %s",
                     attempt, _MAX_RETRIES, response.status_code, response.text,
                 )
-        except (httpx.ConnectError, httpx.TimeoutException, OSError) as exc:
+                retry_after = _retry_after_seconds(response)
+            else:
+                LOGGER.warning(
+                    "Dashboard registration returned HTTP %d: %s; not retrying",
+                    response.status_code, response.text,
+                )
+                return False
+        except (httpx.TransportError, OSError) as exc:
             LOGGER.warning(
                 "Dashboard registration attempt %d/%d failed: %s",
                 attempt, _MAX_RETRIES, exc,
             )
 
         if attempt < _MAX_RETRIES:
-            backoff = _INITIAL_BACKOFF_SECONDS * (2 ** (attempt - 1))
-            LOGGER.info("Retrying registration in %d seconds...", backoff)
+            backoff = min(_BACKOFF_CAP_SECONDS, _INITIAL_BACKOFF_SECONDS * (2 ** (attempt - 1)))
+            # Equal jitter: Pis that boot together after a power loss spread
+            # their retries out instead of hitting the dashboard in lockstep.
+            backoff *= 0.5 + random.random() * 0.5
+            if retry_after is not None:
+                backoff = max(backoff, min(retry_after, _BACKOFF_CAP_SECONDS))
+            LOGGER.info("Retrying registration in %.1f seconds...", backoff)
             await asyncio.sleep(backoff)
 
     LOGGER.error("Failed to register with dashboard after %d attempts", _MAX_RETRIES)
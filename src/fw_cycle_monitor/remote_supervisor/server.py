@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import importlib.util
 import logging
 import os
 from pathlib import Path
@@ -14,7 +15,7 @@ from . import settings
 from .api import app
 from .settings import fix_supervisor_config
 from ..gpio_fix import ensure_gpio_compatibility
-from ..updater import determine_repo_path, sync_environment, update_repository
+from ..updater import DEFAULT_REPO_ROOT, determine_repo_path, sync_environment, update_repository
 
 LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +25,18 @@ def _configure_logging(verbose: bool) -> None:
     logging.basicConfig(level=level, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
 
 
+def _select_event_loop() -> tuple[str, str]:
+    """Return uvicorn's ``loop`` and ``http`` choices, preferring uvloop and httptools.
+
+    Both ship with ``uvicorn[standard]``; fall back to the stdlib loop and h11
+    when a wheel is unavailable so the supervisor still starts.
+    """
+
+    loop = "uvloop" if importlib.util.find_spec("uvloop") is not None else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") is not None else "h11"
+    return loop, http
+
+
 def build_argument_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Run the FW Cycle Monitor remote supervisor API server")
     parser.add_argument("--host", default=None, help="Interface to bind (overrides config file)")
@@ -42,7 +55,7 @@ def main(argv: Optional[list[str]] = None) -> None:
 
     _configure_logging(args.verbose)
 
-    repo_path = determine_repo_path(Path(__file__).resolve().parents[3])
+    repo_path = determine_repo_path(DEFAULT_REPO_ROOT)
     extras = os.environ.get("FW_CYCLE_MONITOR_INSTALL_EXTRAS")
     LOGGER.info("Ensuring repository at %s is up to date", repo_path)
     if update_repository(repo_path):
@@ -71,7 +84,15 @@ def main(argv: Optional[list[str]] = None) -> None:
     certfile = args.certfile or supervisor_settings.certfile
     keyfile = args.keyfile or supervisor_settings.keyfile
 
-    LOGGER.info("Starting remote supervisor on %s:%s targeting unit %s", host, port, supervisor_settings.unit_name)
+    loop, http = _select_event_loop()
+    LOGGER.info(
+        "Starting remote supervisor on %s:%s targeting unit %s (loop=%s, http=%s)",
+        host,
+        port,
+        supervisor_settings.unit_name,
+        loop,
+        http,
+    )
 
     uvicorn.run(
         app,
@@ -79,6 +100,8 @@ def main(argv: Optional[list[str]] = None) -> None:
         port=int(port),
         ssl_certfile=str(certfile) if certfile else None,
         ssl_keyfile=str(keyfile) if keyfile else None,
+        loop=loop,
+        http=http,
         log_level="debug" if args.verbose else "info",
     )
 
@@ -4,10 +4,17 @@ from __future__ import annotations
 
 import logging
 import subprocess
+import threading
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional
 
-from .settings import get_settings
+from .settings import get_unit_name_fast
+
+try:  # pragma: no cover - optional dependency
+    from pystemd.systemd1 import Unit as SystemdUnit  # type: ignore
+except Exception:  # pragma: no cover - pystemd is optional
+    SystemdUnit = None
 
 LOGGER = logging.getLogger(__name__)
 
@@ -61,16 +68,30 @@ class ServiceStatus(dict):
         timestamp = self.get("ExecMainStartTimestamp")
         if not timestamp:
             return None
-        try:
-            # Replace timezone abbreviation with numeric offset for reliable parsing.
-            # systemctl returns e.g. "Thu 2026-02-06 13:08:34 EST"
-            parts = timestamp.rsplit(" ", 1)
-            if len(parts) == 2 and parts[1] in _TZ_OFFSETS:
-                timestamp = parts[0] + " " + _TZ_OFFSETS[parts[1]]
-                return datetime.strptime(timestamp, "%a %Y-%m-%d %H:%M:%S %z")
-            return datetime.strptime(timestamp, "%a %Y-%m-%d %H:%M:%S %Z")
-        except ValueError:
-            return None
+        return _parse_start_timestamp(timestamp)
+
+
+@lru_cache(maxsize=8)
+def _parse_start_timestamp(timestamp: str) -> Optional[datetime]:
+    """Parse an ``ExecMainStartTimestamp`` value.
+
+    Accepts the ISO form produced by the D-Bus reader and systemctl's
+    ``Thu 2026-02-06 13:08:34 EST`` form.  Polls keep reporting the same start
+    time, so results are cached.
+    """
+
+    try:
+        if timestamp[10:11] == "T":
+            return datetime.fromisoformat(timestamp)
+        # Rewrite known abbreviations as a numeric offset for fromisoformat;
+        # strptime's %Z is unreliable for names like "EST".
+        parts = timestamp.split(" ")
+        if len(parts) == 4 and parts[3] in _TZ_OFFSETS:
+            offset = _TZ_OFFSETS[parts[3]]
+            return datetime.fromisoformat(f"{parts[1]}T{parts[2]}{offset[:3]}:{offset[3:]}")
+        return datetime.strptime(timestamp, "%a %Y-%m-%d %H:%M:%S %Z")
+    except ValueError:
+        return None
 
 
 def _run_systemctl(*args: str) -> subprocess.CompletedProcess[str]:
@@ -85,27 +106,81 @@ def _run_systemctl(*args: str) -> subprocess.CompletedProcess[str]:
     return result
 
 
+# Loaded D-Bus unit handles by name, used for status reads when pystemd is
+# installed.  Reads need no privileges, so they skip ``sudo systemctl``.
+_dbus_units: Dict[str, Any] = {}
+_dbus_lock = threading.Lock()
+_dbus_failed = SystemdUnit is None
+
+
+def _dbus_text(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+def _read_status_dbus(unit: str) -> Optional[ServiceStatus]:
+    """Read the status properties over D-Bus, or return ``None`` to use systemctl."""
+
+    global _dbus_failed
+    if _dbus_failed:
+        return None
+    with _dbus_lock:
+        try:
+            handle = _dbus_units.get(unit)
+            if handle is None:
+                handle = SystemdUnit(unit.encode())  # type: ignore[misc]
+                handle.load()
+                _dbus_units[unit] = handle
+            unit_props = handle.Unit
+            data: Dict[str, str] = {
+                "Id": _dbus_text(unit_props.Id),
+                "ActiveState": _dbus_text(unit_props.ActiveState),
+                "SubState": _dbus_text(unit_props.SubState),
+                "UnitFileState": _dbus_text(unit_props.UnitFileState),
+            }
+            service_props = handle.Service
+            data["Result"] = _dbus_text(service_props.Result)
+            data["MainPID"] = str(int(service_props.MainPID))
+            started_usec = int(service_props.ExecMainStartTimestamp)
+        except Exception:
+            LOGGER.debug("Unable to read %s over D-Bus; using systemctl", unit, exc_info=True)
+            _dbus_units.clear()
+            _dbus_failed = True
+            return None
+    # systemctl prints an empty value for an unset timestamp; D-Bus reports 0.
+    data["ExecMainStartTimestamp"] = (
+        datetime.fromtimestamp(started_usec / 1_000_000, timezone.utc).isoformat() if started_usec else ""
+    )
+    return ServiceStatus(data)
+
+
 def get_service_status(unit_name: str | None = None) -> ServiceStatus:
-    """Return ``systemctl show`` metadata for ``unit_name``."""
+    """Return ``systemctl show`` metadata for ``unit_name``.
+
+    The properties are read over D-Bus when pystemd is available, avoiding a
+    ``sudo systemctl`` fork per status poll.
+    """
 
-    unit = unit_name or get_settings().unit_name
+    unit = unit_name or get_unit_name_fast()
+    status = _read_status_dbus(unit)
+    if status is not None:
+        return status
     result = _run_systemctl(
         "show",
         unit,
         f"--property={','.join(STATUS_PROPERTIES)}",
         "--no-page",
     )
-    data: Dict[str, str] = {}
-    for line in result.stdout.splitlines():
-        if "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        data[key] = value
+    # ``partition`` yields an empty separator for lines without "=".
+    data: Dict[str, str] = {
+        key: value
+        for key, separator, value in (line.partition("=") for line in result.stdout.splitlines())
+        if separator
+    }
     return ServiceStatus(data)
 
 
 def _mutate_service(action: str, unit_name: str | None = None) -> ServiceStatus:
-    unit = unit_name or get_settings().unit_name
+    unit = unit_name or get_unit_name_fast()
     _run_systemctl(action, unit)
     return get_service_status(unit)
 
@@ -122,10 +197,17 @@ def restart_service(unit_name: str | None = None) -> ServiceStatus:
     return _mutate_service("restart", unit_name)
 
 
-def status_summary(unit_name: str | None = None) -> Dict[str, object]:
-    status = get_service_status(unit_name)
+def status_summary(unit_name: str | None = None, status: Optional[ServiceStatus] = None) -> Dict[str, object]:
+    """Summarize ``status``, querying the unit when no status is supplied.
+
+    Mutations already fetch the unit's status after acting; pass it in to
+    avoid a second query.
+    """
+
+    if status is None:
+        status = get_service_status(unit_name)
     response: Dict[str, object] = {
-        "unit": unit_name or get_settings().unit_name,
+        "unit": unit_name or get_unit_name_fast(),
         "active_state": status.get("ActiveState"),
         "sub_state": status.get("SubState"),
         "result": status.get("Result"),
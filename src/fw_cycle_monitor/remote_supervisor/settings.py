@@ -8,15 +8,18 @@ import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from threading import RLock
-from typing import List, Optional
+from typing import Any, List, Optional
 
-from ..config import CONFIG_DIR, ensure_config_dir
+from ..config import ensure_config_dir, get_config_dir, json_dumps
 
 LOGGER = logging.getLogger(__name__)
 
-SETTINGS_PATH = CONFIG_DIR / "remote_supervisor.json"
 _SETTINGS_CACHE: RemoteSupervisorSettings | None = None
 _SETTINGS_LOCK = RLock()
+# ``unit_name`` of ``_SETTINGS_CACHE``, readable without taking the lock.
+_SETTINGS_SNAPSHOT_UNIT: str | None = None
+# (st_mtime_ns, st_size, parsed payload) of the last settings file read.
+_FILE_CACHE: tuple[int, int, dict] | None = None
 
 
 @dataclass
@@ -80,18 +83,46 @@ class RemoteSupervisorSettings:
         return bool(self.api_keys)
 
 
+def _settings_path() -> Path:
+    return get_config_dir() / "remote_supervisor.json"
+
+
+def __getattr__(name: str) -> Any:
+    # ``SETTINGS_PATH`` used to be computed at import time; keep it available
+    # as an attribute but only resolve the config directory when requested.
+    if name == "SETTINGS_PATH":
+        return _settings_path()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _read_settings_file() -> dict[str, object]:
+    """Return a copy of the parsed settings file, re-parsing only when it changes."""
+
+    global _FILE_CACHE
+    settings_path = _settings_path()
+    try:
+        stat = settings_path.stat()
+    except OSError:
+        _FILE_CACHE = None
+        return {}
+    cached = _FILE_CACHE
+    if cached is None or cached[0] != stat.st_mtime_ns or cached[1] != stat.st_size:
+        try:
+            data = json.loads(settings_path.read_bytes())
+        except (OSError, json.JSONDecodeError):
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+        cached = _FILE_CACHE = (stat.st_mtime_ns, stat.st_size, data)
+    # Callers overlay environment overrides on the result.
+    return dict(cached[2])
+
+
 def load_settings() -> RemoteSupervisorSettings:
     """Load supervisor settings from disk and environment."""
 
     ensure_config_dir()
-    payload: dict[str, object]
-    if SETTINGS_PATH.exists():
-        try:
-            payload = json.loads(SETTINGS_PATH.read_text())
-        except (OSError, json.JSONDecodeError):
-            payload = {}
-    else:
-        payload = {}
+    payload: dict[str, object] = _read_settings_file()
 
     env_host = os.getenv("FW_REMOTE_SUPERVISOR_HOST")
     if env_host:
@@ -154,19 +185,30 @@ def load_settings() -> RemoteSupervisorSettings:
 def get_settings() -> RemoteSupervisorSettings:
     """Return cached settings, reloading on demand."""
 
-    global _SETTINGS_CACHE
+    global _SETTINGS_CACHE, _SETTINGS_SNAPSHOT_UNIT
     with _SETTINGS_LOCK:
         if _SETTINGS_CACHE is None:
             _SETTINGS_CACHE = load_settings()
+            _SETTINGS_SNAPSHOT_UNIT = _SETTINGS_CACHE.unit_name
         return _SETTINGS_CACHE
 
 
+def get_unit_name_fast() -> str:
+    """Return the configured unit name, skipping the settings lock once loaded."""
+
+    unit_name = _SETTINGS_SNAPSHOT_UNIT
+    if unit_name is None:
+        return get_settings().unit_name
+    return unit_name
+
+
 def refresh_settings() -> RemoteSupervisorSettings:
     """Refresh and return the cached supervisor settings."""
 
-    global _SETTINGS_CACHE
+    global _SETTINGS_CACHE, _SETTINGS_SNAPSHOT_UNIT
     with _SETTINGS_LOCK:
         _SETTINGS_CACHE = load_settings()
+        _SETTINGS_SNAPSHOT_UNIT = _SETTINGS_CACHE.unit_name
         return _SETTINGS_CACHE
 
 
@@ -179,11 +221,14 @@ def fix_supervisor_config() -> bool:
 
     Returns True if changes were written, False otherwise.
     """
-    if not SETTINGS_PATH.exists():
+    global _FILE_CACHE
+
+    settings_path = _settings_path()
+    if not settings_path.exists():
         return False
 
     try:
-        data = json.loads(SETTINGS_PATH.read_text())
+        data = json.loads(settings_path.read_text())
     except (OSError, json.JSONDecodeError):
         return False
 
@@ -198,8 +243,9 @@ def fix_supervisor_config() -> bool:
 
     if changed:
         try:
-            SETTINGS_PATH.write_text(json.dumps(data, indent=2))
-            LOGGER.info("Updated %s", SETTINGS_PATH)
+            settings_path.write_bytes(json_dumps(data))
+            _FILE_CACHE = None
+            LOGGER.info("Updated %s", settings_path)
         except OSError as exc:
             LOGGER.warning("Failed to write config fix: %s", exc)
             return False
@@ -2,17 +2,74 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from datetime import datetime, timezone
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
 
 LOGGER = logging.getLogger(__name__)
 
+_OFF = (False, False, False)
+_GREEN = (True, False, False)
+_AMBER = (False, True, False)
+_RED = (False, False, True)
+_ALL = (True, True, True)
+
+# (green, amber, red) states and the seconds to hold each one, shared by the
+# blocking and async runners.
+_SELF_TEST_STEPS: Tuple[Tuple[Tuple[bool, bool, bool], float], ...] = (
+    # Cycle through each light twice, pausing after the second red
+    (_GREEN, 2.0), (_OFF, 0.0), (_AMBER, 2.0), (_OFF, 0.0), (_RED, 2.0), (_OFF, 0.0),
+    (_GREEN, 2.0), (_OFF, 0.0), (_AMBER, 2.0), (_OFF, 0.0), (_RED, 2.0), (_OFF, 2.0),
+    # All lights ON then OFF twice, pausing after the first all-off
+    (_ALL, 2.0), (_OFF, 2.0),
+    (_ALL, 2.0), (_OFF, 0.0),
+)
+_SELF_TEST_RESULT = {
+    "success": True,
+    "message": "Self-test completed - all relays functioning",
+    "duration_seconds": 26
+}
+
+
+def _test_steps(duration_per_light: float) -> Tuple[Tuple[Tuple[bool, bool, bool], float], ...]:
+    """Return the Green -> Amber -> Red -> All Off test sequence."""
+    return (
+        (_GREEN, duration_per_light),
+        (_AMBER, duration_per_light),
+        (_RED, duration_per_light),
+        (_OFF, duration_per_light),
+    )
+
+
+def _test_result(duration_per_light: float) -> Dict[str, Any]:
+    return {
+        "success": True,
+        "message": "Test sequence completed",
+        "duration_seconds": duration_per_light * 4
+    }
+
 
 class StackLightController:
     """Controls stack light outputs via GPIO with mock mode support."""
 
+    __slots__ = (
+        "pins",
+        "mock_mode",
+        "active_low",
+        "_green",
+        "_amber",
+        "_red",
+        "last_updated",
+        "gpio",
+        "gpio_chip",
+        "_write",
+        "_on_value",
+        "_off_value",
+        "_pin_order",
+    )
+
     def __init__(self, pins: Dict[str, int], mock_mode: bool = False, active_low: bool = True):
         """
         Initialize the stack light controller.
@@ -25,9 +82,17 @@ class StackLightController:
         self.pins = pins
         self.mock_mode = mock_mode
         self.active_low = active_low
-        self.state = {"green": False, "amber": False, "red": False}
-        self.last_updated = None
+        self._green = False
+        self._amber = False
+        self._red = False
+        self.last_updated: Optional[datetime] = None
         self.gpio = None
+        # Bound once by ``_initialize`` so ``set_light_state`` issues three
+        # direct writes without re-checking the GPIO backend or polarity.
+        self._write: Optional[Callable[[int, int], Any]] = None
+        self._on_value = 0
+        self._off_value = 1
+        self._pin_order = (pins["green"], pins["amber"], pins["red"])
 
         if not mock_mode:
             try:
@@ -49,8 +114,8 @@ class StackLightController:
         """Initialize GPIO pins."""
         if self.mock_mode:
             LOGGER.info("Stack light controller initialized in MOCK mode")
-            LOGGER.info(f"Pin configuration: Green={self.pins['green']}, "
-                       f"Amber={self.pins['amber']}, Red={self.pins['red']}")
+            LOGGER.info("Pin configuration: Green=%s, Amber=%s, Red=%s",
+                        self.pins['green'], self.pins['amber'], self.pins['red'])
             return
 
         try:
@@ -64,7 +129,13 @@ class StackLightController:
                     # For active_low: HIGH = OFF, LOW = ON
                     initial_value = self.gpio.HIGH if self.active_low else self.gpio.LOW
                     self.gpio.output(pin, initial_value)
-                    LOGGER.info(f"Initialized {color} light on GPIO BCM pin {pin} (active_low={self.active_low})")
+                    LOGGER.info("Initialized %s light on GPIO BCM pin %s (active_low=%s)", color, pin, self.active_low)
+                # For active_low: ON=LOW, OFF=HIGH; for active_high the reverse.
+                if self.active_low:
+                    self._on_value, self._off_value = self.gpio.LOW, self.gpio.HIGH
+                else:
+                    self._on_value, self._off_value = self.gpio.HIGH, self.gpio.LOW
+                self._write = self.gpio.output
             else:
                 # lgpio style
                 self.gpio_chip = self.gpio.gpiochip_open(0)
@@ -72,71 +143,87 @@ class StackLightController:
                     # Initialize all relays to OFF state
                     initial_value = 1 if self.active_low else 0
                     self.gpio.gpio_claim_output(self.gpio_chip, pin, initial_value)
-                    LOGGER.info(f"Initialized {color} light on GPIO BCM pin {pin} (active_low={self.active_low})")
+                    LOGGER.info("Initialized %s light on GPIO BCM pin %s (active_low=%s)", color, pin, self.active_low)
+                self._on_value, self._off_value = (0, 1) if self.active_low else (1, 0)
+                gpio_write, chip = self.gpio.gpio_write, self.gpio_chip
+                self._write = lambda pin, value: gpio_write(chip, pin, value)
 
             LOGGER.info("Stack light GPIO initialization complete")
         except Exception as e:
-            LOGGER.error(f"Failed to initialize GPIO: {e}", exc_info=True)
+            LOGGER.error("Failed to initialize GPIO: %s", e, exc_info=True)
             LOGGER.warning("Falling back to mock mode")
             self.mock_mode = True
 
-    def set_light_state(self, green: bool, amber: bool, red: bool) -> Dict[str, Any]:
+    def set_light_state(
+        self, green: bool, amber: bool, red: bool, force: bool = False
+    ) -> Dict[str, Any]:
         """
         Set the state of all three lights.
 
+        Requests matching the current state skip the GPIO writes unless
+        ``force`` is set.
+
         Args:
             green: True to turn on green light
             amber: True to turn on amber light
             red: True to turn on red light
+            force: Write the pins even if the state is unchanged
 
         Returns:
             Dictionary with success status and current state
         """
-        try:
-            self.state = {"green": green, "amber": amber, "red": red}
-            self.last_updated = datetime.now(timezone.utc)
+        if (
+            not force
+            and self.last_updated is not None
+            and self._green == green
+            and self._amber == amber
+            and self._red == red
+        ):
+            return {
+                "success": True,
+                "state": self.state,
+                "timestamp": self.last_updated.isoformat(),
+                "noop": True,
+            }
 
+        try:
             if self.mock_mode:
-                LOGGER.info(f"MOCK: Set lights - Green={green}, Amber={amber}, Red={red}")
+                LOGGER.info("MOCK: Set lights - Green=%s, Amber=%s, Red=%s", green, amber, red)
             else:
-                if hasattr(self.gpio, 'output'):
-                    # RPi.GPIO style
-                    for color, value in self.state.items():
-                        pin = self.pins[color]
-                        # For active_low: ON=LOW, OFF=HIGH
-                        # For active_high: ON=HIGH, OFF=LOW
-                        if self.active_low:
-                            gpio_value = self.gpio.LOW if value else self.gpio.HIGH
-                        else:
-                            gpio_value = self.gpio.HIGH if value else self.gpio.LOW
-                        self.gpio.output(pin, gpio_value)
-                else:
-                    # lgpio style
-                    for color, value in self.state.items():
-                        pin = self.pins[color]
-                        # For active_low: ON=0, OFF=1
-                        # For active_high: ON=1, OFF=0
-                        if self.active_low:
-                            gpio_value = 0 if value else 1
-                        else:
-                            gpio_value = 1 if value else 0
-                        self.gpio.gpio_write(self.gpio_chip, pin, gpio_value)
-
-                LOGGER.info(f"Set lights - Green={green}, Amber={amber}, Red={red}")
+                write, on_value, off_value = self._write, self._on_value, self._off_value
+                green_pin, amber_pin, red_pin = self._pin_order
+                write(green_pin, on_value if green else off_value)
+                write(amber_pin, on_value if amber else off_value)
+                write(red_pin, on_value if red else off_value)
+
+                LOGGER.info("Set lights - Green=%s, Amber=%s, Red=%s", green, amber, red)
+
+            # Only record the state once every pin was written, so a failed
+            # write is retried rather than short-circuited as a no-op.
+            self._green, self._amber, self._red = green, amber, red
+            self.last_updated = datetime.now(timezone.utc)
 
             return {
                 "success": True,
-                "state": self.state.copy(),
+                "state": self.state,
                 "timestamp": self.last_updated.isoformat()
             }
         except Exception as e:
-            LOGGER.error(f"Failed to set light state: {e}", exc_info=True)
+            LOGGER.error("Failed to set light state: %s", e, exc_info=True)
+            # Some pins may have changed; the recorded state can no longer be
+            # trusted to skip the next request.
+            self.last_updated = None
             return {
                 "success": False,
                 "error": str(e),
-                "state": self.state.copy()
+                "state": self.state
             }
 
+    @property
+    def state(self) -> Dict[str, bool]:
+        """Current light states as a new ``{"green", "amber", "red"}`` dict."""
+        return {"green": self._green, "amber": self._amber, "red": self._red}
+
     def get_light_state(self) -> Dict[str, Any]:
         """
         Get the current state of all lights.
@@ -145,9 +232,9 @@ class StackLightController:
             Dictionary with current light states and last updated timestamp
         """
         return {
-            "green": self.state["green"],
-            "amber": self.state["amber"],
-            "red": self.state["red"],
+            "green": self._green,
+            "amber": self._amber,
+            "red": self._red,
             "last_updated": self.last_updated.isoformat() if self.last_updated else None
         }
 
@@ -166,6 +253,8 @@ class StackLightController:
 
         Sequence: Green -> Amber -> Red -> All Off
 
+        Blocks the calling thread; use ``test_sequence_async`` from the event loop.
+
         Args:
             duration_per_light: Time in seconds to display each light
 
@@ -173,35 +262,44 @@ class StackLightController:
             Dictionary with success status and total duration
         """
         try:
-            LOGGER.info(f"Starting stack light test sequence ({duration_per_light}s per light)")
-
-            # Green
-            self.set_light_state(True, False, False)
-            time.sleep(duration_per_light)
-
-            # Amber
-            self.set_light_state(False, True, False)
-            time.sleep(duration_per_light)
-
-            # Red
-            self.set_light_state(False, False, True)
-            time.sleep(duration_per_light)
-
-            # All off
-            self.set_light_state(False, False, False)
-            time.sleep(duration_per_light)
-
-            total_duration = duration_per_light * 4
-
+            LOGGER.info("Starting stack light test sequence (%ss per light)", duration_per_light)
+            for lights, delay in _test_steps(duration_per_light):
+                self.set_light_state(*lights, force=True)
+                if delay:
+                    time.sleep(delay)
             LOGGER.info("Stack light test sequence completed")
-
+            return _test_result(duration_per_light)
+        except Exception as e:
+            LOGGER.error("Test sequence failed: %s", e, exc_info=True)
             return {
-                "success": True,
-                "message": "Test sequence completed",
-                "duration_seconds": total_duration
+                "success": False,
+                "error": str(e)
             }
+
+    async def test_sequence_async(
+        self,
+        duration_per_light: float = 2.0,
+        cancel_event: Optional[asyncio.Event] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run ``test_sequence`` without blocking the event loop.
+
+        Setting ``cancel_event`` stops the sequence and leaves the lights to
+        whoever set it; cancelling the task stops it and turns all lights off.
+        """
+        try:
+            LOGGER.info("Starting stack light test sequence (%ss per light)", duration_per_light)
+            if not await self._run_steps_async(_test_steps(duration_per_light), cancel_event):
+                LOGGER.info("Stack light test sequence cancelled")
+                return {
+                    "success": False,
+                    "message": "Test sequence cancelled",
+                    "error": "cancelled",
+                }
+            LOGGER.info("Stack light test sequence completed")
+            return _test_result(duration_per_light)
         except Exception as e:
-            LOGGER.error(f"Test sequence failed: {e}", exc_info=True)
+            LOGGER.error("Test sequence failed: %s", e, exc_info=True)
             return {
                 "success": False,
                 "error": str(e)
@@ -223,58 +321,84 @@ class StackLightController:
 
         Total duration: ~26 seconds
 
+        Blocks the calling thread; use ``startup_self_test_async`` from the event loop.
+
         Returns:
             Dictionary with success status and total duration
         """
         try:
             LOGGER.info("Running startup self-test sequence for stack lights")
-
-            # First cycle through each light twice
-            for cycle in range(2):
-                # Green
-                self.set_light_state(True, False, False)
-                time.sleep(2.0)
-                self.set_light_state(False, False, False)
-
-                # Amber
-                self.set_light_state(False, True, False)
-                time.sleep(2.0)
-                self.set_light_state(False, False, False)
-
-                # Red
-                self.set_light_state(False, False, True)
-                time.sleep(2.0)
-                self.set_light_state(False, False, False)
-
-                # Pause after red on second cycle
-                if cycle == 1:
-                    time.sleep(2.0)
-
-            # All lights ON then OFF twice
-            for cycle in range(2):
-                self.set_light_state(True, True, True)
-                time.sleep(2.0)
-                self.set_light_state(False, False, False)
-
-                # Pause after first all-off
-                if cycle == 0:
-                    time.sleep(2.0)
-
+            for lights, delay in _SELF_TEST_STEPS:
+                self.set_light_state(*lights, force=True)
+                if delay:
+                    time.sleep(delay)
             LOGGER.info("Startup self-test sequence completed successfully")
-
+            return dict(_SELF_TEST_RESULT)
+        except Exception as e:
+            LOGGER.error("Startup self-test failed: %s", e, exc_info=True)
             return {
-                "success": True,
-                "message": "Self-test completed - all relays functioning",
-                "duration_seconds": 26
+                "success": False,
+                "error": str(e),
+                "message": "Self-test failed"
             }
+
+    async def startup_self_test_async(self, cancel_event: Optional[asyncio.Event] = None) -> Dict[str, Any]:
+        """
+        Run ``startup_self_test`` without blocking the event loop.
+
+        Setting ``cancel_event`` stops the sequence and leaves the lights to
+        whoever set it; cancelling the task stops it and turns all lights off.
+        """
+        try:
+            LOGGER.info("Running startup self-test sequence for stack lights")
+            if not await self._run_steps_async(_SELF_TEST_STEPS, cancel_event):
+                LOGGER.info("Startup self-test cancelled")
+                return {
+                    "success": False,
+                    "error": "cancelled",
+                    "message": "Self-test cancelled"
+                }
+            LOGGER.info("Startup self-test sequence completed successfully")
+            return dict(_SELF_TEST_RESULT)
         except Exception as e:
-            LOGGER.error(f"Startup self-test failed: {e}", exc_info=True)
+            LOGGER.error("Startup self-test failed: %s", e, exc_info=True)
             return {
                 "success": False,
                 "error": str(e),
                 "message": "Self-test failed"
             }
 
+    async def _run_steps_async(
+        self,
+        steps: Sequence[Tuple[Tuple[bool, bool, bool], float]],
+        cancel_event: Optional[asyncio.Event],
+    ) -> bool:
+        """Apply ``steps``, returning ``False`` if ``cancel_event`` interrupted them.
+
+        The code that sets ``cancel_event`` owns the lights afterwards (an
+        explicit set/off or the next sequence), so an interrupted sequence
+        leaves them alone. Task cancellation (shutdown) turns them off.
+        """
+        try:
+            for lights, delay in steps:
+                if cancel_event is not None and cancel_event.is_set():
+                    return False
+                self.set_light_state(*lights, force=True)
+                if not delay:
+                    continue
+                if cancel_event is None:
+                    await asyncio.sleep(delay)
+                    continue
+                try:
+                    await asyncio.wait_for(cancel_event.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    continue
+                return False
+        except asyncio.CancelledError:
+            self.turn_off_all()
+            raise
+        return True
+
     def cleanup(self) -> None:
         """Clean up GPIO resources."""
         if self.mock_mode:
@@ -295,4 +419,4 @@ class StackLightController:
 
                 LOGGER.info("Stack light GPIO cleanup complete")
         except Exception as e:
-            LOGGER.error(f"Failed to cleanup GPIO: {e}", exc_info=True)
+            LOGGER.error("Failed to cleanup GPIO: %s", e, exc_info=True)
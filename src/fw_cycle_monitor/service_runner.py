@@ -4,20 +4,43 @@ from __future__ import annotations
 
 import logging
 import os
+import selectors
 import signal
 import sys
 import threading
+import time
 from datetime import datetime
-from pathlib import Path
 from typing import Optional
 
 from .config import AppConfig, load_config
 from .gpio_fix import ensure_gpio_compatibility
 from .gpio_monitor import CycleMonitor, GPIOUnavailableError
-from .updater import determine_repo_path, sync_environment, update_repository
+from .state import flush_cycle_state, load_last_update_check, save_last_update_check
+from .updater import DEFAULT_REPO_ROOT, determine_repo_path, sync_environment, update_repository
 
 LOGGER = logging.getLogger(__name__)
 _STOP_EVENT = threading.Event()
+_DEFAULT_UPDATE_INTERVAL = 3600.0
+_VENV_PATH = DEFAULT_REPO_ROOT / ".venv"
+_LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that runs ``strftime`` at most once per wall-clock second."""
+
+    def __init__(self, fmt: Optional[str] = None) -> None:
+        super().__init__(fmt)
+        self._cached: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, prefix = self._cached
+        if second != cached_second:
+            prefix = time.strftime(self.default_time_format, self.converter(record.created))
+            self._cached = (second, prefix)
+        return self.default_msec_format % (prefix, record.msecs)
 
 
 def _handle_signal(signum: int, _frame: Optional[object]) -> None:
@@ -29,7 +52,13 @@ def _log_cycle_event(timestamp: datetime) -> None:
     LOGGER.info("Cycle logged at %s", timestamp.isoformat())
 
 
-def _install_signal_handlers() -> None:
+def _install_signal_handlers() -> Optional[int]:
+    """Install stop handlers and return a fd that becomes readable on a signal.
+
+    Returns ``None`` when handlers cannot be installed (not the main thread),
+    in which case the caller falls back to polling ``_STOP_EVENT``.
+    """
+
     for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
         try:
             signal.signal(sig, _handle_signal)
@@ -37,6 +66,38 @@ def _install_signal_handlers() -> None:
             # Signal handling is only permitted in the main thread; if this is
             # not the main thread we simply skip installing handlers.
             LOGGER.debug("Unable to install handler for signal %s", sig, exc_info=True)
+            return None
+
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+    os.set_blocking(write_fd, False)
+    try:
+        signal.set_wakeup_fd(write_fd)
+    except ValueError:
+        LOGGER.debug("Unable to install signal wakeup fd", exc_info=True)
+        os.close(read_fd)
+        os.close(write_fd)
+        return None
+    return read_fd
+
+
+def _wait_for_stop(wakeup_fd: Optional[int]) -> None:
+    """Block until ``_STOP_EVENT`` is set, waking only when a signal arrives."""
+
+    if wakeup_fd is None:
+        while not _STOP_EVENT.wait(timeout=1):
+            continue
+        return
+
+    with selectors.DefaultSelector() as selector:
+        selector.register(wakeup_fd, selectors.EVENT_READ)
+        while not _STOP_EVENT.is_set():
+            selector.select()
+            try:
+                while os.read(wakeup_fd, 512):
+                    pass
+            except BlockingIOError:
+                pass
 
 
 def _summarize_config(config: AppConfig) -> str:
@@ -46,12 +107,38 @@ def _summarize_config(config: AppConfig) -> str:
     )
 
 
+def _update_interval() -> float:
+    raw = os.environ.get("FW_CYCLE_MONITOR_UPDATE_INTERVAL")
+    if raw:
+        try:
+            return float(raw)
+        except ValueError:
+            LOGGER.warning("Invalid FW_CYCLE_MONITOR_UPDATE_INTERVAL value: %s", raw)
+    return _DEFAULT_UPDATE_INTERVAL
+
+
 def _refresh_code() -> None:
-    repo_path = determine_repo_path(Path(__file__).resolve().parents[2])
+    interval = _update_interval()
+    last_check = load_last_update_check()
+    now = time.time()
+    if last_check is not None and 0 <= now - last_check < interval:
+        LOGGER.info(
+            "Skipping update check; last check was %.0f seconds ago (interval %.0f)",
+            now - last_check,
+            interval,
+        )
+        return
+
+    repo_path = determine_repo_path(DEFAULT_REPO_ROOT)
     extras = os.environ.get("FW_CYCLE_MONITOR_INSTALL_EXTRAS")
 
     LOGGER.info("Ensuring repository at %s is up to date", repo_path)
-    if update_repository(repo_path):
+    updated = update_repository(repo_path)
+    if updated is None:
+        # Leave the last check untouched so the next start probes again.
+        return
+    save_last_update_check(now)
+    if updated:
         LOGGER.info("Repository updated; refreshing Python package")
         if not sync_environment(repo_path, extras):
             LOGGER.warning(
@@ -60,16 +147,14 @@ def _refresh_code() -> None:
 
 
 def main() -> int:
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    )
+    handler = logging.StreamHandler()
+    handler.setFormatter(_CachedTimeFormatter(_LOG_FORMAT))
+    logging.basicConfig(level=logging.INFO, handlers=[handler])
 
     _refresh_code()
 
     # Ensure GPIO compatibility on Debian 13
-    venv_path = Path(__file__).resolve().parents[2] / ".venv"
-    if not ensure_gpio_compatibility(venv_path):
+    if not ensure_gpio_compatibility(_VENV_PATH):
         LOGGER.warning("GPIO compatibility fix failed; service may not start correctly")
 
     config = load_config()
@@ -85,12 +170,11 @@ def main() -> int:
         LOGGER.exception("Failed to start cycle monitor")
         return 1
 
-    _install_signal_handlers()
+    wakeup_fd = _install_signal_handlers()
     LOGGER.info("Cycle monitor started; waiting for events")
 
     try:
-        while not _STOP_EVENT.wait(timeout=1):
-            continue
+        _wait_for_stop(wakeup_fd)
     except KeyboardInterrupt:
         LOGGER.info("Keyboard interrupt received; stopping monitor")
     finally:
@@ -99,6 +183,7 @@ def main() -> int:
             monitor.stop()
         except Exception:  # pragma: no cover - best effort cleanup
             LOGGER.exception("Error while stopping cycle monitor")
+        flush_cycle_state()
 
     pending = monitor.stats.events_logged
     LOGGER.info("Monitor stopped. Total events logged this session: %s", pending)
@@ -2,20 +2,65 @@
 
 from __future__ import annotations
 
+import atexit
+import errno
 import json
 import logging
+import os
+import threading
 from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
 from typing import Any, Dict, Optional
 
-from .config import CONFIG_DIR, ensure_config_dir
+from .config import ensure_config_dir, fsync_directory, get_config_dir, json_dumps, json_loads
 
 LOGGER = logging.getLogger(__name__)
 
-STATE_PATH = CONFIG_DIR / "state.json"
 _STATE_TMP_SUFFIX = ".tmp"
+_STATE_NEW_SUFFIX = ".new"
 
-__all__ = ["MachineState", "load_cycle_state", "save_cycle_state", "clear_cycle_state"]
+# Parsed state blob and the (st_ino, st_mtime_ns, st_size) of the file it was
+# read from or last written to. The GUI clears state from its own process, so
+# the cache is only trusted while the file on disk still matches.
+_STATE_CACHE: Optional[Dict[str, Any]] = None
+_STATE_SIGNATURE: Optional[tuple[int, int, int]] = None
+# Serializes every read-modify-write of the cache and state.json within this
+# process. Atomic rename alone prevents torn files, not lost updates, so
+# writers must hold this lock; it is reentrant so helpers can take it too.
+_WRITER_LOCK = threading.RLock()
+
+# Saved entries not yet on disk, keyed by machine id. They are written back
+# at most every ``_FLUSH_INTERVAL`` seconds, on ``flush_cycle_state`` and at
+# exit; the CSV sidecar is still written per event for crash recovery.
+_PENDING: Dict[str, Dict[str, Any]] = {}
+_FLUSH_INTERVAL = 5.0
+_FLUSH_TIMER: Optional[threading.Timer] = None
+
+__all__ = [
+    "MachineState",
+    "get_state_path",
+    "load_cycle_state",
+    "save_cycle_state",
+    "clear_cycle_state",
+    "flush_cycle_state",
+    "load_last_update_check",
+    "save_last_update_check",
+]
+
+
+def get_state_path() -> Path:
+    """Return the path of the runtime state file."""
+
+    return get_config_dir() / "state.json"
+
+
+def __getattr__(name: str) -> Any:
+    # ``STATE_PATH`` used to be computed at import time; keep it available as
+    # an attribute but only resolve the config directory when requested.
+    if name == "STATE_PATH":
+        return get_state_path()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @dataclass
@@ -27,40 +72,174 @@ class MachineState:
     last_timestamp: datetime
 
 
+def _state_signature() -> Optional[tuple[int, int, int]]:
+    try:
+        stat = get_state_path().stat()
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
 def _load_state_blob() -> Dict[str, Any]:
-    if not STATE_PATH.exists():
-        return {}
     try:
-        return json.loads(STATE_PATH.read_text())
+        return json_loads(get_state_path().read_bytes())
+    except FileNotFoundError:
+        return {}
     except (json.JSONDecodeError, OSError) as exc:
-        LOGGER.warning("Failed to load state file %s: %s", STATE_PATH, exc)
+        LOGGER.warning("Failed to load state file %s: %s", get_state_path(), exc)
         return {}
 
 
-def _save_state_blob(data: Dict[str, Any]) -> None:
-    ensure_config_dir()
-    tmp_path = STATE_PATH.with_suffix(STATE_PATH.suffix + _STATE_TMP_SUFFIX)
+def _get_state_blob() -> Dict[str, Any]:
+    """Return the cached state blob, re-reading state.json only when it changed.
+
+    Callers must hold ``_WRITER_LOCK`` and may mutate the result in place.
+    """
+
+    global _STATE_CACHE, _STATE_SIGNATURE
+    signature = _state_signature()
+    if _STATE_CACHE is None or signature != _STATE_SIGNATURE:
+        data = _load_state_blob()
+        if not isinstance(data, dict):
+            data = {}
+        if _PENDING:
+            # Keep unflushed saves on top of whatever another process wrote.
+            machines = data.get("machines")
+            if not isinstance(machines, dict):
+                machines = data["machines"] = {}
+            machines.update(_PENDING)
+        _STATE_CACHE = data
+        _STATE_SIGNATURE = signature
+    return _STATE_CACHE
+
+
+def _replace_via_tmpfile(payload: bytes) -> bool:
+    """Replace state.json using an unnamed ``O_TMPFILE`` inode.
+
+    The data only gets a name once it is fully written and synced, so a crash
+    mid-write leaves no temporary file behind. Returns False when the platform
+    or filesystem lacks ``O_TMPFILE`` so the caller can use a named temp file.
+    """
+
+    flag = getattr(os, "O_TMPFILE", None)
+    if flag is None:
+        return False
+    state_path = get_state_path()
+    dir_fd = os.open(state_path.parent, os.O_RDONLY | os.O_DIRECTORY)
     try:
-        tmp_path.write_text(json.dumps(data, indent=2))
-        tmp_path.replace(STATE_PATH)
-    except OSError:
-        LOGGER.exception("Unable to persist cycle state to %s", STATE_PATH)
         try:
-            tmp_path.unlink(missing_ok=True)  # type: ignore[arg-type]
+            fd = os.open(".", os.O_WRONLY | flag, 0o666, dir_fd=dir_fd)
+        except OSError as exc:
+            if exc.errno in (errno.EOPNOTSUPP, errno.EISDIR, errno.EINVAL):
+                return False
+            raise
+        link_name = state_path.name + _STATE_NEW_SUFFIX
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+            try:
+                os.unlink(link_name, dir_fd=dir_fd)
+            except FileNotFoundError:
+                pass
+            # Passing a dir fd makes os.link use linkat(AT_SYMLINK_FOLLOW),
+            # which is what gives the /proc fd link a name.
+            try:
+                os.link(f"/proc/self/fd/{fd}", link_name, dst_dir_fd=dir_fd)
+            except OSError as exc:
+                # No /proc, or a kernel that refuses the link: fall back.
+                if exc.errno in (errno.ENOENT, errno.EXDEV, errno.EPERM):
+                    return False
+                raise
+        finally:
+            os.close(fd)
+        try:
+            os.replace(link_name, state_path.name, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+        except OSError:
+            os.unlink(link_name, dir_fd=dir_fd)
+            raise
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+    return True
+
+
+def _save_state_blob(data: Dict[str, Any]) -> bool:
+    global _STATE_CACHE, _STATE_SIGNATURE
+    ensure_config_dir()
+    state_path = get_state_path()
+    tmp_path = state_path.with_suffix(state_path.suffix + _STATE_TMP_SUFFIX)
+    with _WRITER_LOCK:
+        try:
+            payload = json_dumps(data)
+            if not _replace_via_tmpfile(payload):
+                try:
+                    with tmp_path.open("wb") as tmp_file:
+                        tmp_file.write(payload)
+                        tmp_file.flush()
+                        os.fsync(tmp_file.fileno())
+                    tmp_path.replace(state_path)
+                except OSError:
+                    try:
+                        tmp_path.unlink(missing_ok=True)  # type: ignore[arg-type]
+                    except OSError:
+                        LOGGER.debug("Failed to remove temporary state file %s", tmp_path, exc_info=True)
+                    raise
+                fsync_directory(state_path.parent)
+            _STATE_SIGNATURE = _state_signature()
+            _PENDING.clear()
+            return True
         except OSError:
-            LOGGER.debug("Failed to remove temporary state file %s", tmp_path, exc_info=True)
+            LOGGER.exception("Unable to persist cycle state to %s", state_path)
+            # The in-memory copy no longer matches disk; re-read on next access.
+            _STATE_CACHE = None
+            _STATE_SIGNATURE = None
+            return False
+
+
+def _schedule_flush() -> None:
+    """Arm the write-back timer if it is not already pending.
+
+    Callers must hold ``_WRITER_LOCK``.
+    """
+
+    global _FLUSH_TIMER
+    if _FLUSH_TIMER is not None:
+        return
+    timer = threading.Timer(_FLUSH_INTERVAL, flush_cycle_state)
+    timer.daemon = True
+    timer.start()
+    _FLUSH_TIMER = timer
+
+
+def flush_cycle_state() -> None:
+    """Write any saved but unflushed cycle state to disk."""
+
+    global _FLUSH_TIMER
+    with _WRITER_LOCK:
+        timer, _FLUSH_TIMER = _FLUSH_TIMER, None
+        if timer is not None:
+            timer.cancel()
+        if not _PENDING:
+            return
+        if not _save_state_blob(_get_state_blob()):
+            _schedule_flush()
+
+
+atexit.register(flush_cycle_state)
 
 
 def load_cycle_state(machine_id: str) -> Optional[MachineState]:
     """Load the stored state for ``machine_id`` if it exists."""
 
-    data = _load_state_blob()
-    machines = data.get("machines")
-    if not isinstance(machines, dict):
-        LOGGER.debug("State file %s does not contain machine mapping", STATE_PATH)
-        return None
+    with _WRITER_LOCK:
+        machines = _get_state_blob().get("machines")
+        if not isinstance(machines, dict):
+            LOGGER.debug("State file %s does not contain machine mapping", get_state_path())
+            return None
+        raw_state = machines.get(machine_id)
 
-    raw_state = machines.get(machine_id)
     if not isinstance(raw_state, dict):
         LOGGER.debug("No stored state found for machine %s", machine_id)
         return None
@@ -82,36 +261,75 @@ def load_cycle_state(machine_id: str) -> Optional[MachineState]:
     return MachineState(machine_id=machine_id, last_cycle=last_cycle, last_timestamp=last_timestamp)
 
 
-def save_cycle_state(machine_id: str, *, last_cycle: int, last_timestamp: datetime) -> None:
-    """Persist the latest cycle details for ``machine_id``."""
+def save_cycle_state(
+    machine_id: str,
+    *,
+    last_cycle: int,
+    last_timestamp: datetime,
+    last_timestamp_iso: Optional[str] = None,
+) -> None:
+    """Persist the latest cycle details for ``machine_id``.
 
-    data = _load_state_blob()
-    machines = data.setdefault("machines", {})
-    if not isinstance(machines, dict):
-        machines = {}
-        data["machines"] = machines
+    The write to state.json is deferred by up to ``_FLUSH_INTERVAL`` seconds;
+    call ``flush_cycle_state`` to force it. ``last_timestamp_iso`` may carry
+    ``last_timestamp.isoformat()`` when the caller has already serialized it.
+    """
 
-    machines[machine_id] = {
-        "last_cycle": int(last_cycle),
-        "last_timestamp": last_timestamp.isoformat(),
-    }
+    timestamp_iso = last_timestamp_iso or last_timestamp.isoformat()
+    with _WRITER_LOCK:
+        data = _get_state_blob()
+        machines = data.setdefault("machines", {})
+        if not isinstance(machines, dict):
+            machines = {}
+            data["machines"] = machines
 
-    _save_state_blob(data)
+        entry = {
+            "last_cycle": int(last_cycle),
+            "last_timestamp": timestamp_iso,
+        }
+        if machines.get(machine_id) == entry:
+            LOGGER.debug("Cycle state for %s unchanged; skipping write", machine_id)
+            return
+        machines[machine_id] = entry
+        _PENDING[machine_id] = entry
+        _schedule_flush()
     LOGGER.debug(
-        "Persisted cycle state for %s to %s (cycle=%s, timestamp=%s)",
+        "Queued cycle state for %s to %s (cycle=%s, timestamp=%s)",
         machine_id,
-        STATE_PATH,
+        get_state_path(),
         last_cycle,
-        last_timestamp.isoformat(),
+        timestamp_iso,
     )
 
 
 def clear_cycle_state(machine_id: str) -> None:
     """Remove stored state for ``machine_id``."""
 
-    data = _load_state_blob()
-    machines = data.get("machines")
-    if not isinstance(machines, dict) or machine_id not in machines:
-        return
-    machines.pop(machine_id, None)
-    _save_state_blob(data)
+    with _WRITER_LOCK:
+        data = _get_state_blob()
+        _PENDING.pop(machine_id, None)
+        machines = data.get("machines")
+        if not isinstance(machines, dict) or machine_id not in machines:
+            return
+        machines.pop(machine_id, None)
+        _save_state_blob(data)
+
+
+def load_last_update_check() -> Optional[float]:
+    """Return the epoch seconds of the last completed update check, if recorded."""
+
+    with _WRITER_LOCK:
+        value = _get_state_blob().get("last_update_check")
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def save_last_update_check(checked_at: float) -> None:
+    """Record ``checked_at`` (epoch seconds) as the last completed update check."""
+
+    with _WRITER_LOCK:
+        data = _get_state_blob()
+        data["last_update_check"] = checked_at
+        _save_state_blob(data)
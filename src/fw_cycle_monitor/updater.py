@@ -4,30 +4,56 @@ from __future__ import annotations
 
 import logging
 import os
+import shutil
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 LOGGER = logging.getLogger(__name__)
 
+# Snapshot of the process environment for git, taken once at import; the
+# service and launcher do not change their environment after start-up.
+_GIT_ENV = {**os.environ, "LC_ALL": "C"}
 
-def _run_git_command(args: list[str], repo_path: Path) -> subprocess.CompletedProcess[str]:
+# ``fw_cycle_monitor`` lives in ``src/fw_cycle_monitor`` so two parents up
+# yields the repository root when running from an installed checkout.
+DEFAULT_REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _run_git_capture(args: list[str], repo_path: Path) -> subprocess.CompletedProcess[str]:
+    """Run a git query whose stdout is parsed."""
     return subprocess.run(
         ["git", *args],
         cwd=repo_path,
         check=True,
         capture_output=True,
         text=True,
-        env={**os.environ, "LC_ALL": "C"},
+        env=_GIT_ENV,
     )
 
 
+def _run_git_quiet(args: list[str], repo_path: Path) -> subprocess.CompletedProcess[str]:
+    """Run a git command for its side effect, keeping only stderr for errors."""
+    return subprocess.run(
+        ["git", *args],
+        cwd=repo_path,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=_GIT_ENV,
+    )
+
+
+@lru_cache(maxsize=8)
 def determine_repo_path(default: Optional[Path] = None) -> Path:
     """Return the path to the project repository.
 
     Prefers the ``FW_CYCLE_MONITOR_REPO`` environment variable when set and
     otherwise falls back to the provided default or the package directory.
+    The result is resolved once per ``default`` for the life of the process.
     """
 
     repo_env = os.environ.get("FW_CYCLE_MONITOR_REPO")
@@ -40,15 +66,15 @@ def determine_repo_path(default: Optional[Path] = None) -> Path:
     if default is not None:
         return default
 
-    # ``fw_cycle_monitor`` lives in ``src/fw_cycle_monitor`` so two parents up
-    # yields the repository root when running from an installed checkout.
-    return Path(__file__).resolve().parents[2]
+    return DEFAULT_REPO_ROOT
 
 
-def update_repository(repo_path: Path, remote: str = "origin", branch: str = "main") -> bool:
+def update_repository(repo_path: Path, remote: str = "origin", branch: str = "main") -> Optional[bool]:
     """Fetch updates from the remote and fast-forward if needed.
 
-    Returns ``True`` when a new revision was pulled.
+    Returns ``True`` when a new revision was pulled, ``False`` when the check
+    completed with nothing to apply, and ``None`` when a git command failed
+    (for example because the network is not up yet).
     """
 
     git_dir = repo_path / ".git"
@@ -56,35 +82,39 @@ def update_repository(repo_path: Path, remote: str = "origin", branch: str = "ma
         LOGGER.info("%s is not a git repository; skipping update", repo_path)
         return False
 
+    # ``ls-remote`` asks the remote for the branch tip directly, so the
+    # common "nothing new" poll needs no local fetch or remote listing.
     try:
-        remotes = _run_git_command(["remote"], repo_path).stdout.splitlines()
+        advertised = _run_git_capture(
+            ["ls-remote", remote, f"refs/heads/{branch}"], repo_path
+        ).stdout.split()
+        local_rev = _run_git_capture(["rev-parse", "HEAD"], repo_path).stdout.strip()
     except subprocess.CalledProcessError as exc:
-        LOGGER.warning("Git command failed: %s", exc)
-        return False
+        LOGGER.warning("Git command failed: %s: %s", exc, (exc.stderr or "").strip())
+        return None
 
-    if remote not in remotes:
-        LOGGER.info("Remote '%s' is not configured; skipping update", remote)
-        return False
-
-    try:
-        _run_git_command(["fetch", remote], repo_path)
-        local_rev = _run_git_command(["rev-parse", "HEAD"], repo_path).stdout.strip()
-        remote_rev = _run_git_command(["rev-parse", f"{remote}/{branch}"], repo_path).stdout.strip()
-    except subprocess.CalledProcessError as exc:
-        LOGGER.warning("Git command failed: %s", exc)
+    if not advertised:
+        LOGGER.info("Branch '%s' not found on remote '%s'; skipping update", branch, remote)
         return False
 
+    remote_rev = advertised[0]
     if local_rev == remote_rev:
         LOGGER.info("Repository already up to date")
         return False
 
     LOGGER.info("Updating repository to %s", remote_rev)
     try:
-        _run_git_command(["pull", "--ff-only", remote, branch], repo_path)
-        return True
-    except subprocess.CalledProcessError:
-        LOGGER.exception("Failed to fast-forward repository")
+        _run_git_quiet(["pull", "--quiet", "--ff-only", remote, branch], repo_path)
+        new_rev = _run_git_capture(["rev-parse", "HEAD"], repo_path).stdout.strip()
+    except subprocess.CalledProcessError as exc:
+        LOGGER.error("Failed to fast-forward repository: %s", (exc.stderr or "").strip() or exc)
+        return None
+
+    if new_rev == local_rev:
+        # Local commits ahead of the remote: nothing was pulled.
+        LOGGER.info("Repository has no upstream changes to apply")
         return False
+    return True
 
 
 def relaunch_if_updated(repo_path: Path, module: str) -> Optional[int]:
@@ -112,7 +142,8 @@ def sync_environment(repo_path: Path, extras: Optional[str] = None) -> bool:
 
     When the repository updates we need to refresh the site-packages copy of
     the project so new modules and dependency pins are available.  This helper
-    issues a ``pip install --upgrade`` against the local checkout.
+    issues a ``pip install --upgrade`` against the local checkout, through
+    ``uv`` when it is on ``PATH`` and plain pip otherwise.
     """
 
     extras = (extras or "").strip()
@@ -122,6 +153,17 @@ def sync_environment(repo_path: Path, extras: Optional[str] = None) -> bool:
         target = str(repo_path)
 
     LOGGER.info("Synchronising virtual environment from %s", target)
+    uv = shutil.which("uv")
+    if uv:
+        try:
+            subprocess.run(
+                [uv, "pip", "install", "--python", sys.executable, "--upgrade", target],
+                check=True,
+            )
+            return True
+        except (OSError, subprocess.CalledProcessError):
+            LOGGER.warning("uv install failed; falling back to pip", exc_info=True)
+
     try:
         subprocess.run(
             [sys.executable, "-m", "pip", "install", "--upgrade", target],